@@ -10,20 +10,34 @@ This module handles all application configuration including:
 - Environment-specific configurations
 
 Usage:
-    from config import config
+    from config import get_config
 
-    # Access configuration values
-    db_host = config.db_host
+    # Access configuration values (built on first call, then cached)
+    config = get_config()
+    db_host = config.database.host
 
     # Validate configuration on startup
     config.validate()
 ================================================================================
 """
 
+import atexit
+import hashlib
+import json
+import logging
+import logging.handlers
 import os
+import queue
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
+
+from __version__ import __version__
+
+ENV_FILE_PATH = Path(__file__).parent / ".env"
+VALIDATION_CACHE_PATH = Path(__file__).parent / ".cache" / "config_valid.hash"
 
 
 def load_env_file():
@@ -31,9 +45,8 @@ def load_env_file():
     try:
         from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
 
-        env_path = Path(__file__).parent / ".env"
-        if env_path.exists():
-            load_dotenv(dotenv_path=env_path)
+        if ENV_FILE_PATH.exists():
+            load_dotenv(dotenv_path=ENV_FILE_PATH)
             return True
         return False
     except ImportError:
@@ -41,23 +54,61 @@ def load_env_file():
         return False
 
 
-# Load .env file if available
-load_env_file()
+# Load .env file if available (set SKIP_DOTENV=1 to rely on the process environment only)
+if os.getenv("SKIP_DOTENV") != "1":
+    load_env_file()
+
+# Snapshot of the process environment used by the config field factories.
+# Reading a plain dict is cheaper than going through os.environ on every lookup.
+_ENV_CACHE: dict[str, str] = dict(os.environ)
+
 
+def _optional_int(name: str) -> Optional[int]:
+    """Read an integer setting from the cached environment, None when unset or empty"""
+    value = _ENV_CACHE.get(name)
+    return int(value) if value else None
 
-@dataclass
+
+def refresh_env_cache() -> None:
+    """Re-read os.environ into the cached snapshot (e.g. after tests patch the environment)"""
+    _ENV_CACHE.clear()
+    _ENV_CACHE.update(os.environ)
+
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class DatabaseConfig:
     """Database connection configuration"""
 
-    host: str = field(default_factory=lambda: os.getenv("DB_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("DB_PORT", "5432")))
-    name: str = field(default_factory=lambda: os.getenv("DB_NAME", "trading"))
-    user: str = field(default_factory=lambda: os.getenv("DB_USER", "postgres"))
-    password: str = field(default_factory=lambda: os.getenv("DB_PASSWORD", ""))
+    host: str = field(default_factory=lambda: _ENV_CACHE.get("DB_HOST", "localhost"))
+    port: int = field(default_factory=lambda: int(_ENV_CACHE.get("DB_PORT", "5432")))
+    name: str = field(default_factory=lambda: _ENV_CACHE.get("DB_NAME", "trading"))
+    user: str = field(default_factory=lambda: _ENV_CACHE.get("DB_USER", "postgres"))
+    password: str = field(default_factory=lambda: _ENV_CACHE.get("DB_PASSWORD", ""))
+
+    # Connection pool settings (None = sized from the server's max_connections and CPU count)
+    min_connections: Optional[int] = field(default_factory=lambda: _optional_int("DB_MIN_CONN"))
+    max_connections: Optional[int] = field(default_factory=lambda: _optional_int("DB_MAX_CONN"))
+    # Seconds a pooled connection may live before it is closed instead of reused (0 = forever)
+    connection_max_lifetime: int = field(
+        default_factory=lambda: int(_ENV_CACHE.get("DB_CONN_MAX_LIFETIME", "1800"))
+    )
 
-    # Connection pool settings
-    min_connections: int = field(default_factory=lambda: int(os.getenv("DB_MIN_CONN", "5")))
-    max_connections: int = field(default_factory=lambda: int(os.getenv("DB_MAX_CONN", "20")))
+    # Connection string, built once in __post_init__
+    _conn_str: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        # The dataclass is frozen, so bypass its __setattr__ for the derived field
+        object.__setattr__(
+            self,
+            "_conn_str",
+            (
+                f"host={self.host} "
+                f"port={self.port} "
+                f"dbname={self.name} "
+                f"user={self.user} "
+                f"password={self.password}"
+            ),
+        )
 
     def validate(self) -> list[str]:
         """
@@ -80,15 +131,27 @@ class DatabaseConfig:
         if self.port < 1 or self.port > 65535:
             errors.append(f"DB_PORT must be between 1-65535, got: {self.port}")
 
-        if self.min_connections < 1:
+        if self.min_connections is not None and self.min_connections < 1:
             errors.append(f"DB_MIN_CONN must be >= 1, got: {self.min_connections}")
 
-        if self.max_connections < self.min_connections:
+        if self.max_connections is not None and self.max_connections < 1:
+            errors.append(f"DB_MAX_CONN must be >= 1, got: {self.max_connections}")
+
+        if (
+            self.min_connections is not None
+            and self.max_connections is not None
+            and self.max_connections < self.min_connections
+        ):
             errors.append(
                 f"DB_MAX_CONN ({self.max_connections}) "
                 f"must be >= DB_MIN_CONN ({self.min_connections})"
             )
 
+        if self.connection_max_lifetime < 0:
+            errors.append(
+                f"DB_CONN_MAX_LIFETIME must be >= 0 seconds, got: {self.connection_max_lifetime}"
+            )
+
         return errors
 
     def get_connection_string(self) -> str:
@@ -98,21 +161,17 @@ class DatabaseConfig:
         Returns:
             Connection string for psycopg2
         """
-        return (
-            f"host={self.host} "
-            f"port={self.port} "
-            f"dbname={self.name} "
-            f"user={self.user} "
-            f"password={self.password}"
-        )
+        return self._conn_str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class SchwabAPIConfig:
     """Charles Schwab API configuration"""
 
-    app_key: Optional[str] = field(default_factory=lambda: os.getenv("APP_KEY_SCHWAB"))
-    client_secret: Optional[str] = field(default_factory=lambda: os.getenv("CLIENT_SECRET_SCHWAB"))
+    app_key: Optional[str] = field(default_factory=lambda: _ENV_CACHE.get("APP_KEY_SCHWAB"))
+    client_secret: Optional[str] = field(
+        default_factory=lambda: _ENV_CACHE.get("CLIENT_SECRET_SCHWAB")
+    )
 
     def validate(self) -> list[str]:
         """
@@ -132,20 +191,41 @@ class SchwabAPIConfig:
         return errors
 
 
-@dataclass
 class OptionalAPIConfig:
     """Optional third-party API configurations"""
 
-    alpha_vantage_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("ALPHA_VANTAGE_API_KEY")
+    __slots__ = (
+        "alpha_vantage_key",
+        "polygon_key",
+        "fmp_key",
+        "alpaca_client_id",
+        "alpaca_client_secret",
+        "intrinio_key",
     )
-    polygon_key: Optional[str] = field(default_factory=lambda: os.getenv("POLYGON_API_KEY"))
-    fmp_key: Optional[str] = field(default_factory=lambda: os.getenv("FMP_API_KEY"))
-    alpaca_client_id: Optional[str] = field(default_factory=lambda: os.getenv("ALPACA_CLIENT_ID"))
-    alpaca_client_secret: Optional[str] = field(
-        default_factory=lambda: os.getenv("ALPACA_CLIENT_SECRET")
+
+    def __init__(self, env: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Read the optional API keys
+
+        Args:
+            env: Mapping to read the keys from (defaults to the cached environment)
+        """
+        env = _ENV_CACHE if env is None else env
+        self.alpha_vantage_key: Optional[str] = env.get("ALPHA_VANTAGE_API_KEY")
+        self.polygon_key: Optional[str] = env.get("POLYGON_API_KEY")
+        self.fmp_key: Optional[str] = env.get("FMP_API_KEY")
+        self.alpaca_client_id: Optional[str] = env.get("ALPACA_CLIENT_ID")
+        self.alpaca_client_secret: Optional[str] = env.get("ALPACA_CLIENT_SECRET")
+        self.intrinio_key: Optional[str] = env.get("INTRINIO_API_KEY")
+
+    # (attributes that must all be set, display name), in display order
+    _API_MAP = (
+        (("alpha_vantage_key",), "Alpha Vantage"),
+        (("polygon_key",), "Polygon.io"),
+        (("fmp_key",), "Financial Modeling Prep"),
+        (("alpaca_client_id", "alpaca_client_secret"), "Alpaca Markets"),
+        (("intrinio_key",), "Intrinio"),
     )
-    intrinio_key: Optional[str] = field(default_factory=lambda: os.getenv("INTRINIO_API_KEY"))
 
     def get_configured_apis(self) -> list[str]:
         """
@@ -154,40 +234,37 @@ class OptionalAPIConfig:
         Returns:
             List of API names that have credentials configured
         """
-        configured = []
+        return [
+            name
+            for attributes, name in self._API_MAP
+            if all(getattr(self, attribute) for attribute in attributes)
+        ]
 
-        if self.alpha_vantage_key:
-            configured.append("Alpha Vantage")
-        if self.polygon_key:
-            configured.append("Polygon.io")
-        if self.fmp_key:
-            configured.append("Financial Modeling Prep")
-        if self.alpaca_client_id and self.alpaca_client_secret:
-            configured.append("Alpaca Markets")
-        if self.intrinio_key:
-            configured.append("Intrinio")
 
-        return configured
+# Accepted values for ApplicationConfig settings
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_LOG_FORMATS = frozenset({"text", "json"})
+_VALID_ENVIRONMENTS = frozenset({"development", "testing", "production"})
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class ApplicationConfig:
     """Application-level configuration"""
 
     # Scanner settings
-    sleep_time: int = field(default_factory=lambda: int(os.getenv("SCANNER_SLEEP_TIME", "10")))
+    sleep_time: int = field(default_factory=lambda: int(_ENV_CACHE.get("SCANNER_SLEEP_TIME", "10")))
     output_length: int = field(
-        default_factory=lambda: int(os.getenv("SCANNER_OUTPUT_LENGTH", "15"))
+        default_factory=lambda: int(_ENV_CACHE.get("SCANNER_OUTPUT_LENGTH", "15"))
     )
 
     # Logging settings
-    log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    log_level: str = field(default_factory=lambda: _ENV_CACHE.get("LOG_LEVEL", "INFO"))
     log_format: str = field(
-        default_factory=lambda: os.getenv("LOG_FORMAT", "text")  # 'text' or 'json'
+        default_factory=lambda: _ENV_CACHE.get("LOG_FORMAT", "text")  # 'text' or 'json'
     )
 
     # Environment
-    environment: str = field(default_factory=lambda: os.getenv("ENVIRONMENT", "development"))
+    environment: str = field(default_factory=lambda: _ENV_CACHE.get("ENVIRONMENT", "development"))
 
     def validate(self) -> list[str]:
         """
@@ -210,18 +287,21 @@ class ApplicationConfig:
         if self.output_length < 1:
             errors.append(f"SCANNER_OUTPUT_LENGTH must be >= 1, got: {self.output_length}")
 
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_log_levels:
-            errors.append(f"LOG_LEVEL must be one of {valid_log_levels}, got: {self.log_level}")
+        log_level = self.log_level.upper()
+        if log_level not in _VALID_LOG_LEVELS:
+            errors.append(
+                f"LOG_LEVEL must be one of {sorted(_VALID_LOG_LEVELS)}, got: {self.log_level}"
+            )
 
-        valid_log_formats = ["text", "json"]
-        if self.log_format not in valid_log_formats:
-            errors.append(f"LOG_FORMAT must be one of {valid_log_formats}, got: {self.log_format}")
+        if self.log_format not in _VALID_LOG_FORMATS:
+            errors.append(
+                f"LOG_FORMAT must be one of {sorted(_VALID_LOG_FORMATS)}, got: {self.log_format}"
+            )
 
-        valid_environments = ["development", "testing", "production"]
-        if self.environment not in valid_environments:
+        if self.environment not in _VALID_ENVIRONMENTS:
             errors.append(
-                f"ENVIRONMENT must be one of {valid_environments}, got: {self.environment}"
+                f"ENVIRONMENT must be one of {sorted(_VALID_ENVIRONMENTS)}, "
+                f"got: {self.environment}"
             )
 
         return errors
@@ -237,7 +317,7 @@ class ApplicationConfig:
         return self.environment == "development"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class Config:
     """
     Master configuration class
@@ -279,74 +359,212 @@ class Config:
 
     def print_summary(self) -> None:
         """Print configuration summary (safe for logging)"""
-        print("=" * 80)
-        print("Configuration Summary")
-        print("=" * 80)
-
-        print("\nDatabase:")
-        print(f"  Host: {self.database.host}:{self.database.port}")
-        print(f"  Database: {self.database.name}")
-        print(f"  User: {self.database.user}")
-        print(
-            f"  Password: {'*' * len(self.database.password) \
-                             if self.database.password else '(not set)'}"
-        )
-        print(f"  Connection Pool: {self.database.min_connections}-{self.database.max_connections}")
-
-        print("\nSchwab API:")
-        print(f"  App Key: {'*' * 20 if self.schwab_api.app_key else '(not set)'}")
-        print(f"  Client Secret: {'*' * 20 if self.schwab_api.client_secret else '(not set)'}")
+        separator = "=" * 80
+        masked = "*" * 20
+        not_set = "(not set)"
+        database = self.database
+        password = "*" * len(database.password) if database.password else not_set
+        min_conn = database.min_connections or "auto"
+        max_conn = database.max_connections or "auto"
+
+        lines = [
+            separator,
+            "Configuration Summary",
+            separator,
+            "",
+            "Database:",
+            f"  Host: {database.host}:{database.port}",
+            f"  Database: {database.name}",
+            f"  User: {database.user}",
+            f"  Password: {password}",
+            f"  Connection Pool: {min_conn}-{max_conn}",
+            "",
+            "Schwab API:",
+            f"  App Key: {masked if self.schwab_api.app_key else not_set}",
+            f"  Client Secret: {masked if self.schwab_api.client_secret else not_set}",
+            "",
+            "Optional APIs:",
+        ]
 
         configured_apis = self.optional_apis.get_configured_apis()
-        print("\nOptional APIs:")
         if configured_apis:
-            for api in configured_apis:
-                print(f"  ✓ {api}")
+            lines.extend(f"  ✓ {api}" for api in configured_apis)
         else:
-            print("  (none configured)")
+            lines.append("  (none configured)")
+
+        lines.extend(
+            [
+                "",
+                "Application:",
+                f"  Environment: {self.app.environment}",
+                f"  Sleep Time: {self.app.sleep_time} seconds",
+                f"  Output Length: {self.app.output_length}",
+                f"  Log Level: {self.app.log_level}",
+                f"  Log Format: {self.app.log_format}",
+                separator,
+            ]
+        )
 
-        print("\nApplication:")
-        print(f"  Environment: {self.app.environment}")
-        print(f"  Sleep Time: {self.app.sleep_time} seconds")
-        print(f"  Output Length: {self.app.output_length}")
-        print(f"  Log Level: {self.app.log_level}")
-        print(f"  Log Format: {self.app.log_format}")
+        # One write instead of a print() (and stdout lock round-trip) per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        print("=" * 80)
 
+# Convenience functions
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Get the global configuration instance
 
-# Global configuration instance
-config = Config()
+    The instance is built lazily on first use so that importing this module
+    (or anything that depends on it) does not evaluate the configuration.
+
+    Returns:
+        Config instance
+    """
+    return Config()
+
+
+# Environment variables read by the validated configuration sections
+_VALIDATED_ENV_KEYS = (
+    "DB_HOST",
+    "DB_PORT",
+    "DB_NAME",
+    "DB_USER",
+    "DB_PASSWORD",
+    "DB_MIN_CONN",
+    "DB_MAX_CONN",
+    "DB_CONN_MAX_LIFETIME",
+    "APP_KEY_SCHWAB",
+    "CLIENT_SECRET_SCHWAB",
+    "SCANNER_SLEEP_TIME",
+    "SCANNER_OUTPUT_LENGTH",
+    "LOG_LEVEL",
+    "LOG_FORMAT",
+    "ENVIRONMENT",
+)
+
+
+def _validation_digest(require_schwab: bool) -> str:
+    """
+    Digest of everything validation depends on: the validated settings, the .env
+    mtime, the mode and the package version (so new validation rules apply on upgrade)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        digest.update(str(ENV_FILE_PATH.stat().st_mtime_ns).encode())
+    except OSError:
+        digest.update(b"no .env")
+    digest.update(f"{__version__}\0".encode())
+    digest.update(b"schwab" if require_schwab else b"no schwab")
+    for key in _VALIDATED_ENV_KEYS:
+        value = _ENV_CACHE.get(key)
+        digest.update(f"{key}={value}\0".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
 
 
-# Convenience functions
 def validate_config(require_schwab: bool = True) -> None:
     """
     Validate configuration and raise if invalid
 
+    A successful validation is remembered (.cache/config_valid.hash) and skipped
+    on later runs while the validated settings, .env file and version are unchanged. Set
+    SCANNER_DEV=1 to always validate.
+
     Args:
         require_schwab: If True, Schwab API credentials are required
 
     Raises:
         ValueError: If configuration is invalid
     """
-    config.validate(require_schwab=require_schwab)
+    dev_mode = _ENV_CACHE.get("SCANNER_DEV") == "1"
+    digest = _validation_digest(require_schwab)
+    if not dev_mode:
+        try:
+            if VALIDATION_CACHE_PATH.read_text(encoding="utf-8") == digest:
+                return
+        except OSError:
+            pass
 
+    get_config().validate(require_schwab=require_schwab)
 
-def get_config() -> Config:
+    try:
+        VALIDATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        VALIDATION_CACHE_PATH.write_text(digest, encoding="utf-8")
+    except OSError:
+        # Read-only checkout or similar, just validate again next time
+        pass
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects (LOG_FORMAT=json)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload)
+
+
+# Background thread writing queued log records (see configure_logging)
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush and stop the log listener thread, if one is running"""
+    global _LOG_LISTENER  # pylint: disable=global-statement
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
+
+
+def configure_logging(app_config: Optional[ApplicationConfig] = None) -> None:
     """
-    Get the global configuration instance
+    Configure the root logger from LOG_LEVEL and LOG_FORMAT
 
-    Returns:
-        Config instance
+    Records are put on a queue and written to stderr by a single listener thread, so
+    scanner threads never wait on console I/O.
+
+    Args:
+        app_config: Application settings to use (defaults to the global configuration)
     """
-    return config
+    global _LOG_LISTENER  # pylint: disable=global-statement
+    app_config = app_config or get_config().app
+    handler = logging.StreamHandler()
+    if app_config.log_format == "json":
+        handler.setFormatter(JsonLogFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    _stop_log_listener()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _LOG_LISTENER = logging.handlers.QueueListener(log_queue, handler)
+    _LOG_LISTENER.start()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Only merge the arguments into the message; the listener's handler formats the record
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=app_config.log_level.upper(), handlers=[queue_handler], force=True)
+
+
+atexit.register(_stop_log_listener)
+
+
+def __getattr__(name: str):
+    """Keep `from config import config` working by resolving it lazily"""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     # Test configuration when run directly
     try:
         print("Testing configuration...")
+        config = get_config()
         config.validate(require_schwab=False)
         config.print_summary()
         print("\n✓ Configuration is valid!")
@@ -27,6 +27,22 @@ Example:
     ... )
 """
 
-from .scanners_db import DatabaseConnection, InsertData, RetrieveData, UpdateData
+from .scanners_db import (
+    INSERT_DATA,
+    RETRIEVE,
+    UPDATE_DATA,
+    DatabaseConnection,
+    InsertData,
+    RetrieveData,
+    UpdateData,
+)
 
-__all__ = ["DatabaseConnection", "InsertData", "RetrieveData", "UpdateData"]
+__all__ = [
+    "DatabaseConnection",
+    "InsertData",
+    "RetrieveData",
+    "UpdateData",
+    "INSERT_DATA",
+    "RETRIEVE",
+    "UPDATE_DATA",
+]
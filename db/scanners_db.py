@@ -5,19 +5,36 @@ efficiently using a threaded connection pool.
 """
 
 import atexit
+import contextlib
+import hashlib
+import io
+import itertools
+import json
+import logging
 import os
+import re
 import sys
-from typing import Optional
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 
-from psycopg2 import DatabaseError, OperationalError
-from psycopg2.pool import ThreadedConnectionPool
+import psycopg2
+from psycopg2 import DatabaseError, InterfaceError, OperationalError, sql
+
+# psycopg2.pool and psycopg2.extras are imported where they are first needed, so
+# importing this module (e.g. through helpers or scanner) stays cheap until a query runs.
 
 # Import centralized configuration
 try:
-    from config import config
+    from config import get_config
 except ImportError:
     # Fallback if config module not available
-    config = None
+    get_config = None
+
+LOGGER = logging.getLogger(__name__)
 
 
 class DatabaseConnection:
@@ -27,6 +44,25 @@ class DatabaseConnection:
 
     # Class-level variable for the connection pool
     connection_pool = None
+    _pool_lock = threading.Lock()
+
+    # Seconds a connection may live before release_connection() closes it (0 = forever)
+    connection_max_lifetime = 0
+    _connection_created: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    # Connections idle for longer than this (seconds) are validated before being handed out
+    HEALTH_CHECK_INTERVAL = 30
+    _last_validated: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    # Fallback pool bounds when the server cannot be asked for max_connections
+    DEFAULT_MIN_CONNECTIONS = 5
+    DEFAULT_MAX_CONNECTIONS = 20
+
+    # ThreadedConnectionPool raises PoolError as soon as every connection is checked out.
+    # Checkouts are gated by a semaphore sized to maxconn so callers queue instead,
+    # giving up after CHECKOUT_TIMEOUT seconds.
+    CHECKOUT_TIMEOUT = 30
+    _checkout_slots = None
 
     @classmethod
     def initialize_pool(cls, minconn, maxconn, **db_params):
@@ -35,9 +71,91 @@ class DatabaseConnection:
         This should be called once, typically when the application starts.
         """
         if cls.connection_pool is None:
+            # pylint: disable=import-outside-toplevel
+            from psycopg2.extras import register_uuid
+            from psycopg2.pool import ThreadedConnectionPool
+
+            # UUID columns come back as uuid.UUID, and uuid.UUID values can be sent
+            register_uuid()
             cls.connection_pool = ThreadedConnectionPool(
                 minconn=minconn, maxconn=maxconn, **db_params
             )
+            cls._checkout_slots = threading.BoundedSemaphore(maxconn)
+
+    @classmethod
+    def _autotune_pool(cls, **db_params) -> tuple[int, int]:
+        """
+        Size the pool from the server's max_connections and the local CPU count.
+
+        Uses at most half of the server's connection slots (leaving room for other
+        clients) and no more than four connections per CPU.
+
+        Returns:
+            tuple: (minconn, maxconn)
+        """
+        try:
+            probe = psycopg2.connect(**db_params)
+            try:
+                with probe.cursor() as cursor:
+                    cursor.execute("SHOW max_connections")
+                    server_max = int(cursor.fetchone()[0])
+            finally:
+                probe.close()
+        except (OperationalError, DatabaseError) as e:
+            LOGGER.warning("Could not read max_connections, using default pool size: %s", e)
+            return cls.DEFAULT_MIN_CONNECTIONS, cls.DEFAULT_MAX_CONNECTIONS
+
+        maxconn = max(2, min(server_max // 2, 4 * (os.cpu_count() or 1)))
+        minconn = max(2, maxconn // 4)
+        return minconn, maxconn
+
+    @classmethod
+    def _ensure_pool(cls):
+        """
+        Initialize the connection pool on first use.
+        Settings come from the centralized configuration, falling back to
+        environment variables when the config module is not available.
+        Pool bounds that are not configured are auto-tuned.
+        """
+        if cls.connection_pool is not None:
+            return
+        with cls._pool_lock:
+            if cls.connection_pool is not None:
+                return
+            if get_config is not None:
+                # Use config module (recommended)
+                db_config = get_config().database
+                minconn = db_config.min_connections
+                maxconn = db_config.max_connections
+                cls.connection_max_lifetime = db_config.connection_max_lifetime
+                db_params = {
+                    "host": db_config.host,
+                    "port": db_config.port,
+                    "database": db_config.name,
+                    "user": db_config.user,
+                    "password": db_config.password,
+                }
+            else:
+                # Fallback to environment variables only (legacy support)
+                minconn = int(os.getenv("DB_MIN_CONN") or 0) or None
+                maxconn = int(os.getenv("DB_MAX_CONN") or 0) or None
+                cls.connection_max_lifetime = int(os.getenv("DB_CONN_MAX_LIFETIME", "1800"))
+                db_params = {
+                    "host": os.getenv("DB_HOST", "localhost"),
+                    "port": int(os.getenv("DB_PORT", "5432")),
+                    "database": os.getenv("DB_NAME", "trading"),
+                    "user": os.getenv("DB_USER", "postgres"),
+                    "password": os.getenv("DB_PASSWORD", ""),
+                }
+
+            if minconn is None or maxconn is None:
+                tuned_min, tuned_max = cls._autotune_pool(**db_params)
+                if maxconn is None:
+                    maxconn = max(tuned_max, minconn or 0)
+                if minconn is None:
+                    minconn = min(tuned_min, maxconn)
+
+            cls.initialize_pool(minconn=minconn, maxconn=maxconn, **db_params)
 
     @classmethod
     def close_pool(cls):
@@ -48,14 +166,58 @@ class DatabaseConnection:
         if cls.connection_pool is not None:
             cls.connection_pool.closeall()
 
+    @classmethod
+    def _is_healthy(cls, connection) -> bool:
+        """
+        Check that a pooled connection is still usable.
+
+        A cheap SELECT 1 is only issued when the connection has not been validated
+        in the last HEALTH_CHECK_INTERVAL seconds.
+        """
+        if connection.closed:
+            return False
+        now = time.monotonic()
+        last_validated = cls._last_validated.get(connection)
+        if last_validated is not None and now - last_validated < cls.HEALTH_CHECK_INTERVAL:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+        except (OperationalError, InterfaceError):
+            return False
+        cls._last_validated[connection] = now
+        return True
+
+    @classmethod
+    def _checkout_from_pool(cls):
+        """Take a connection from the pool and record when it was first seen"""
+        connection = cls.connection_pool.getconn()
+        cls._connection_created.setdefault(connection, time.monotonic())
+        return connection
+
     @classmethod
     def get_connection(cls):
         """
-        Get a connection from the pool.
+        Get a connection from the pool, initializing the pool on first use.
+        A connection that fails its health check is discarded and replaced once.
+        Blocks for up to CHECKOUT_TIMEOUT seconds while all connections are in use.
         """
-        if cls.connection_pool is None:
-            raise ConnectionError("Connection pool is not initialized.")
-        return cls.connection_pool.getconn()
+        cls._ensure_pool()
+        if not cls._checkout_slots.acquire(timeout=cls.CHECKOUT_TIMEOUT):
+            # pylint: disable=import-outside-toplevel
+            from psycopg2.pool import PoolError
+
+            raise PoolError(f"No connection available after {cls.CHECKOUT_TIMEOUT} seconds")
+        try:
+            connection = cls._checkout_from_pool()
+            if not cls._is_healthy(connection):
+                cls.connection_pool.putconn(connection, close=True)
+                connection = cls._checkout_from_pool()
+        except BaseException:
+            cls._checkout_slots.release()
+            raise
+        return connection
 
     @classmethod
     def release_connection(cls, connection):
@@ -65,45 +227,267 @@ class DatabaseConnection:
         Parameters:
         - connection: The connection object to be returned to the pool.
 
+        Connections older than connection_max_lifetime are closed instead of
+        being kept, so the pool opens a fresh one on the next checkout.
+
         returns: None
         """
         if cls.connection_pool is not None:
-            cls.connection_pool.putconn(connection)
+            created = cls._connection_created.get(connection)
+            expired = (
+                cls.connection_max_lifetime > 0
+                and created is not None
+                and time.monotonic() - created > cls.connection_max_lifetime
+            )
+            try:
+                cls.connection_pool.putconn(connection, close=expired)
+            finally:
+                cls._checkout_slots.release()
+
+
+# Names of the server-side prepared statements created on each pooled connection.
+# Prepared statements live as long as the PostgreSQL session, so they are tracked per
+# connection object and forgotten automatically when the connection is discarded.
+_PREPARED_STATEMENTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_PLACEHOLDER_PATTERN = re.compile(r"%s")
+
+# insert_many switches from execute_values to COPY at this many rows
+COPY_THRESHOLD = 1000
+
+
+def _to_server_placeholders(query: str) -> tuple[str, int]:
+    """
+    Convert psycopg2 %s placeholders to PostgreSQL positional parameters ($1, $2, ...).
+
+    Returns:
+        tuple: The converted query and the number of parameters it takes.
+    """
+    counter = itertools.count(1)
+    converted = _PLACEHOLDER_PATTERN.sub(lambda _: f"${next(counter)}", query)
+    return converted, next(counter) - 1
+
+
+def _table_identifier(table: str) -> sql.Identifier:
+    """Quote a possibly schema-qualified table name ("schema.table")"""
+    return sql.Identifier(*table.split("."))
+
+
+def _column_list(columns: tuple[str, ...]) -> sql.Composed:
+    """Quote and comma-join a sequence of column names"""
+    return sql.SQL(", ").join(sql.Identifier(column) for column in columns)
+
+
+@lru_cache(maxsize=256)
+def _insert_statement(table: str, columns: tuple[str, ...]) -> sql.Composed:
+    """INSERT statement for execute_values (the single %s receives all row tuples)"""
+    return sql.SQL("INSERT INTO {table} ({columns}) VALUES %s").format(
+        table=_table_identifier(table), columns=_column_list(columns)
+    )
+
+
+@lru_cache(maxsize=256)
+def _copy_statement(table: str, columns: tuple[str, ...]) -> sql.Composed:
+    """COPY ... FROM STDIN statement reading text-format rows for the given columns"""
+    return sql.SQL("COPY {table} ({columns}) FROM STDIN").format(
+        table=_table_identifier(table), columns=_column_list(columns)
+    )
+
+
+# Characters escaped in COPY text format (backslash first, so escapes are not doubled)
+_COPY_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def _db_value(value):
+    """
+    Normalize a value before it is sent by insert_many (either path)
+
+    Aware datetimes are converted to UTC, so execute_values (psycopg2 renders them with
+    isoformat()) and COPY (see _copy_field) send the same text for the same instant.
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc)
+    return value
+
+
+def _copy_field(value) -> str:
+    """Render a value as a COPY text-format field (None becomes \\N)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (list, tuple)):
+        elements = (
+            (
+                "NULL"
+                if item is None
+                else '"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+            )
+            for item in value
+        )
+        text = "{" + ",".join(elements) + "}"
+    elif isinstance(value, dict):
+        text = json.dumps(value)
+    elif isinstance(value, datetime):
+        # Same ISO 8601 text as psycopg2's datetime adapter (offset kept for aware values)
+        text = value.isoformat()
+    else:
+        text = str(value)
+    for character, escaped in _COPY_ESCAPES:
+        text = text.replace(character, escaped)
+    return text
+
+
+@lru_cache(maxsize=256)
+def _insert_row_statement(table: str, columns: tuple[str, ...]) -> sql.Composed:
+    """Single-row INSERT statement with one %s placeholder per column (for PREPARE)"""
+    return sql.SQL("INSERT INTO {table} ({columns}) VALUES ({placeholders})").format(
+        table=_table_identifier(table),
+        columns=_column_list(columns),
+        placeholders=sql.SQL(", ").join(sql.Placeholder() * len(columns)),
+    )
+
+
+@lru_cache(maxsize=256)
+def _select_statement(
+    table: str,
+    column: Optional[str],
+    condition_column: Optional[str],
+    limit: Optional[int] = None,
+) -> sql.Composed:
+    """SELECT statement with an optional equality WHERE clause and row limit"""
+    if column is None or column.strip() == "*":
+        selected = sql.SQL("*")
+    else:
+        selected = _column_list(tuple(name.strip() for name in column.split(",")))
+    query = sql.SQL("SELECT {columns} FROM {table}").format(
+        columns=selected, table=_table_identifier(table)
+    )
+    if condition_column:
+        query += sql.SQL(" WHERE {condition} = %s").format(
+            condition=sql.Identifier(condition_column)
+        )
+    if limit is not None:
+        query += sql.SQL(" LIMIT {limit}").format(limit=sql.Literal(int(limit)))
+    return query
+
+
+@lru_cache(maxsize=64)
+def _array_agg_statement(table: str, column: str) -> sql.Composed:
+    """SELECT returning every value of one column aggregated into a single array"""
+    return sql.SQL("SELECT array_agg({column}) FROM {table}").format(
+        column=sql.Identifier(column), table=_table_identifier(table)
+    )
+
+
+@lru_cache(maxsize=256)
+def _latest_statement(table: str, columns: tuple[str, ...], order_column: str) -> sql.Composed:
+    """SELECT of the newest row by order_column (served by an index on that column)"""
+    return sql.SQL("SELECT {columns} FROM {table} ORDER BY {order} DESC LIMIT 1").format(
+        columns=_column_list(columns),
+        table=_table_identifier(table),
+        order=sql.Identifier(order_column),
+    )
+
+
+@lru_cache(maxsize=256)
+def _update_statement(table: str, columns: tuple[str, ...], where_column: str) -> sql.Composed:
+    """UPDATE statement setting each column and filtering on one equality condition"""
+    set_clause = sql.SQL(", ").join(
+        sql.SQL("{} = %s").format(sql.Identifier(column)) for column in columns
+    )
+    return sql.SQL("UPDATE {table} SET {set_clause} WHERE {where} = %s").format(
+        table=_table_identifier(table),
+        set_clause=set_clause,
+        where=sql.Identifier(where_column),
+    )
+
+
+@lru_cache(maxsize=256)
+def _update_many_statement(table: str, columns: tuple[str, ...], where_column: str) -> sql.Composed:
+    """UPDATE ... FROM (VALUES %s) statement for execute_values, matching on where_column"""
+    set_clause = sql.SQL(", ").join(
+        sql.SQL("{column} = v.{column}").format(column=sql.Identifier(column)) for column in columns
+    )
+    return sql.SQL(
+        "UPDATE {table} AS t SET {set_clause} FROM (VALUES %s) AS v ({value_columns}) "
+        "WHERE t.{where} = v.{where}"
+    ).format(
+        table=_table_identifier(table),
+        set_clause=set_clause,
+        value_columns=_column_list((where_column,) + columns),
+        where=sql.Identifier(where_column),
+    )
 
 
 class DatabaseOperation:
     """
     Base class for database operations.
-    Provides methods to open and close connections using the connection pool.
+    Provides a context manager that checks a connection out of the pool.
+
+    Operations hold no state, so a single module-level instance can be shared
+    between threads.
     """
 
-    def __init__(self):
-        """
-        Initialize the DatabaseOperation with no active connection or cursor.
-        """
-        self.conn = None
-        self.cursor = None
+    __slots__ = ()
 
-    def open_connection(self):
+    @contextlib.contextmanager
+    def _checkout(self):
         """
-        Acquire a connection from the pool and initialize a cursor.
+        Acquire a pooled connection and a cursor for the duration of a with-block.
+
+        Nothing is stored on the instance, so one operation object can be shared
+        between threads. The transaction is rolled back if the block raises, and
+        the connection is always returned to the pool.
+
+        Yields:
+            tuple: (connection, cursor)
         """
-        self.conn = DatabaseConnection.get_connection()
-        self.cursor = self.conn.cursor()
+        conn = DatabaseConnection.get_connection()
+        try:
+            with conn.cursor() as cursor:
+                yield conn, cursor
+        except BaseException:
+            if not conn.closed:
+                try:
+                    conn.rollback()
+                except (OperationalError, InterfaceError):
+                    pass
+            raise
+        finally:
+            DatabaseConnection.release_connection(conn)
 
-    def close_connection(self):
+    @staticmethod
+    def execute_prepared(cursor, query: str | sql.Composable, params: tuple = ()):
         """
-        Close the cursor and release the connection back to the pool.
+        Execute a query through a server-side prepared statement.
+
+        The statement is prepared once per pooled connection (named after a hash of
+        the query text) so PostgreSQL skips parsing and planning on repeated calls.
+        The query must use %s placeholders only.
+
+        Parameters:
+        - cursor: Cursor of the connection to run the statement on.
+        - query (str | sql.Composable): The SQL query with %s placeholders.
+        - params (tuple): The parameters to be passed to the query.
         """
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            DatabaseConnection.release_connection(self.conn)
+        if isinstance(query, sql.Composable):
+            query = query.as_string(cursor)
+        statement_name = "q_" + hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+        prepared = _PREPARED_STATEMENTS.setdefault(cursor.connection, set())
+        server_query, param_count = _to_server_placeholders(query)
+        if statement_name not in prepared:
+            cursor.execute(f"PREPARE {statement_name} AS {server_query}")
+            prepared.add(statement_name)
+        if param_count:
+            placeholders = ", ".join(["%s"] * param_count)
+            cursor.execute(f"EXECUTE {statement_name} ({placeholders})", params)
+        else:
+            cursor.execute(f"EXECUTE {statement_name}")
 
 
 class InsertData(DatabaseOperation):
     """Insert data into DB"""
 
+    __slots__ = ()
+
     def insert_data(self, table: str, data: dict):
         """
         Insert data into the specified table.
@@ -112,24 +496,96 @@ class InsertData(DatabaseOperation):
         - table: Name of the table to insert data into.
         - data: A dictionary where keys are column names and values are the values to be inserted.
 
+        The statement is run as a server-side prepared statement, so repeated inserts
+        into the same table and columns (e.g. scanner rows) are parsed and planned once
+        per connection.
+
         Returns: None
 
         Example:
         insert_data("users", {"name": "Alice", "age": 30})
         """
+        columns = tuple(data.keys())
         try:
-            self.open_connection()
-            columns = ", ".join(data.keys())
-            placeholders = ", ".join(["%s"] * len(data))
-            insert_query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-            values_to_insert = list(data.values())
-            self.cursor.execute(insert_query, values_to_insert)
-            self.conn.commit()
+            with self._checkout() as (conn, cursor):
+                self.execute_prepared(
+                    cursor, _insert_row_statement(table, columns), tuple(data.values())
+                )
+                conn.commit()
         except (OperationalError, DatabaseError) as e:
-            print(f"Error: {e}")
-            self.conn.rollback()
-        finally:
-            self.close_connection()
+            LOGGER.error("Insert into %s failed: %s", table, e)
+
+    def insert_many(self, table: str, rows: list[dict], page_size: int = 1000) -> bool:
+        """
+        Insert several rows into the specified table in a single round-trip.
+
+        All rows must share the keys of the first row; they are sent with
+        psycopg2's execute_values (or COPY from COPY_THRESHOLD rows on) and
+        committed once at the end. Aware datetimes are sent in UTC on both paths.
+
+        Parameters:
+        - table: Name of the table to insert data into.
+        - rows: List of dictionaries mapping column names to values.
+        - page_size: Maximum number of rows per generated INSERT statement.
+
+        Returns: True if the rows were committed (or there were none), False if the
+        insert failed (the error is logged).
+
+        Example:
+        insert_many("users", [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}])
+        """
+        if not rows:
+            return True
+        # Values are looked up by column name, so rows may list their keys in any order
+        columns = tuple(rows[0].keys())
+        values_to_insert = [tuple(_db_value(row[column]) for column in columns) for row in rows]
+        if len(rows) >= COPY_THRESHOLD:
+            return self.copy_rows(table, columns, values_to_insert)
+        # pylint: disable=import-outside-toplevel
+        from psycopg2.extras import execute_values
+
+        insert_query = _insert_statement(table, columns)
+        try:
+            with self._checkout() as (conn, cursor):
+                execute_values(cursor, insert_query, values_to_insert, page_size=page_size)
+                conn.commit()
+        except (OperationalError, DatabaseError) as e:
+            LOGGER.error("Insert into %s failed: %s", table, e)
+            return False
+        return True
+
+    def copy_rows(self, table: str, columns: tuple[str, ...], rows: Iterable[Iterable]) -> bool:
+        """
+        Bulk-load rows into the specified table with COPY FROM STDIN.
+
+        Faster than INSERT for large batches since PostgreSQL parses no statement per
+        row. Rows are sent in COPY text format; lists and tuples are written as array
+        literals, dicts as JSON and datetimes in ISO 8601.
+
+        Parameters:
+        - table: Name of the table to load into.
+        - columns: Column names, in the order of each row's values.
+        - rows: Iterable of rows, each an iterable of values in columns order.
+
+        Returns: True if the rows were committed, False if the COPY failed
+        (the error is logged).
+
+        Example:
+        copy_rows("users", ("name", "age"), [("Alice", 30), ("Bob", 25)])
+        """
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_field(value) for value in row))
+            buffer.write("\n")
+        buffer.seek(0)
+        try:
+            with self._checkout() as (conn, cursor):
+                cursor.copy_expert(_copy_statement(table, tuple(columns)), buffer)
+                conn.commit()
+        except (OperationalError, DatabaseError) as e:
+            LOGGER.error("Copy into %s failed: %s", table, e)
+            return False
+        return True
 
 
 class RetrieveData(DatabaseOperation):
@@ -137,6 +593,8 @@ class RetrieveData(DatabaseOperation):
     Retrieve data from the database.
     """
 
+    __slots__ = ()
+
     # pylint: disable=too-many-positional-arguments,too-many-arguments
     def retrieve_data(
         self,
@@ -145,6 +603,7 @@ class RetrieveData(DatabaseOperation):
         condition_value: Optional[str] = None,
         column: Optional[str] = None,
         fetch_all: Optional[bool] = True,
+        limit: Optional[int] = None,
     ) -> list:
         """
         Retrieve data from a table with an optional WHERE clause using parameterized queries.
@@ -155,6 +614,7 @@ class RetrieveData(DatabaseOperation):
         - condition_value (str): Value for the WHERE clause (optional).
         - column (str): Specific column to retrieve (optional, defaults to all columns).
         - fetch_all (bool): If True, fetch all results; otherwise, fetch one. Defaults to True.
+        - limit (int): Maximum number of rows the server returns (optional, no limit by default).
 
         Returns:
             list: List of results if fetch_all is True; otherwise, a single result.
@@ -170,22 +630,96 @@ class RetrieveData(DatabaseOperation):
         )
         """
         try:
-            self.open_connection()
-            column = column or "*"
-            query = f"SELECT {column} FROM {table_name}"
-            if condition_column and condition_value:
-                query += f" WHERE {condition_column} = %s"
-                self.cursor.execute(query, (condition_value,))
-            else:
-                self.cursor.execute(query)
-            if fetch_all:
-                return self.cursor.fetchall()
-            return self.cursor.fetchone()
+            with self._checkout() as (_, cursor):
+                if condition_column and condition_value:
+                    query = _select_statement(table_name, column, condition_column, limit)
+                    self.execute_prepared(cursor, query, (condition_value,))
+                else:
+                    cursor.execute(_select_statement(table_name, column, None, limit))
+                if fetch_all:
+                    return cursor.fetchall()
+                return cursor.fetchone()
         except (OperationalError, DatabaseError) as e:
-            print(f"Error: {e}")
+            LOGGER.error("Select from %s failed: %s", table_name, e)
             return []
-        finally:
-            self.close_connection()
+
+    def retrieve_array(self, table_name: str, column: str) -> list:
+        """
+        Retrieve every value of one column as a list, aggregated with array_agg server-side.
+
+        PostgreSQL returns a single row holding the array, so no tuple is built per row.
+
+        Parameters:
+        - table_name (str): Name of the table to query.
+        - column (str): Column whose values are collected.
+
+        Returns:
+            list: The column's values (empty if the table is empty or the query fails).
+        """
+        try:
+            with self._checkout() as (_, cursor):
+                cursor.execute(_array_agg_statement(table_name, column))
+                row = cursor.fetchone()
+        except (OperationalError, DatabaseError) as e:
+            LOGGER.error("Select from %s failed: %s", table_name, e)
+            return []
+        return row[0] if row and row[0] is not None else []
+
+    def retrieve_row(
+        self,
+        columns: tuple[str, ...],
+        table_name: str,
+        condition_column: str,
+        condition_value: Any,
+    ) -> Optional[tuple]:
+        """
+        Retrieve several columns of the first row matching a condition in one query.
+
+        Parameters:
+        - columns (tuple): Columns to retrieve, in the order they are returned.
+        - table_name (str): Name of the table to query.
+        - condition_column (str): Column name for the WHERE clause.
+        - condition_value: Value for the WHERE clause.
+
+        Returns:
+            tuple | None: The row, or None if nothing matches or the query fails.
+
+        Example:
+        - Retrieves the quote time and UUID of AAPL:
+            quote_time, stock_uuid = retrieve_row(
+                ("quote_time", "stock_uuid"), "equities.stock_data", "ticker", "AAPL"
+            )
+        """
+        query = _select_statement(table_name, ", ".join(columns), condition_column, limit=1)
+        try:
+            with self._checkout() as (_, cursor):
+                self.execute_prepared(cursor, query, (condition_value,))
+                return cursor.fetchone()
+        except (OperationalError, DatabaseError) as e:
+            LOGGER.error("Select row from %s failed: %s", table_name, e)
+            return None
+
+    def retrieve_latest(
+        self, table_name: str, columns: tuple[str, ...], order_column: str = "time"
+    ) -> Optional[tuple]:
+        """
+        Retrieve the newest row of a table instead of fetching every row.
+
+        Parameters:
+        - table_name (str): Name of the table to query.
+        - columns (tuple): Columns to retrieve.
+        - order_column (str): Column that orders the rows (defaults to "time").
+
+        Returns:
+            tuple | None: The newest row, or None if the table is empty or the query fails.
+        """
+        try:
+            with self._checkout() as (_, cursor):
+                cursor.execute(_latest_statement(table_name, tuple(columns), order_column))
+                return cursor.fetchone()
+        except (OperationalError, DatabaseError) as e:
+            LOGGER.error("Select latest from %s failed: %s", table_name, e)
+            return None
 
     def execute_custom_query(
         self,
@@ -193,17 +727,20 @@ class RetrieveData(DatabaseOperation):
         params: tuple = (),
         retrieve: bool = True,
         fetch_all: bool = True,
-    ) -> list:
+    ) -> list | tuple | int:
         """
         Execute a custom SQL query.
 
         Parameters:
             query (str): The SQL query string with placeholders for parameters.
             params (tuple): A tuple containing the parameters to be passed to the query.
+            retrieve (bool): If True, return the query results; otherwise, commit and
+                return the number of affected rows.
             fetch_all (bool): If True, fetch all results; otherwise, fetch one.
 
         Returns:
             list: List of results if fetch_all is True; otherwise, a single result.
+            int: Number of affected rows when retrieve is False (0 on error).
 
         Example:
         - Retrieves names of users older than 25
@@ -215,27 +752,24 @@ class RetrieveData(DatabaseOperation):
             )
         """
         try:
-            self.open_connection()
-            if retrieve:
-                self.cursor.execute(query, params)
+            with self._checkout() as (conn, cursor):
+                cursor.execute(query, params)
+                if not retrieve:
+                    conn.commit()
+                    return cursor.rowcount
                 if fetch_all:
-                    return self.cursor.fetchall()
-                return self.cursor.fetchone()
-            self.cursor.execute(query, params)
-            self.conn.commit()
+                    return cursor.fetchall()
+                return cursor.fetchone()
         except (OperationalError, DatabaseError) as e:
-            print(f"Error executing custom query: {e}")
-            if not retrieve:
-                self.conn.rollback()
-            return []
-        finally:
-            self.close_connection()
-        return []
+            LOGGER.error("Custom query failed: %s", e)
+            return [] if retrieve else 0
 
 
 class UpdateData(DatabaseOperation):
     """Update data in DB"""
 
+    __slots__ = ()
+
     def update_data(
         self,
         table: str,
@@ -255,50 +789,66 @@ class UpdateData(DatabaseOperation):
         - where_constraint_data (str): The value used in the WHERE clause
             for the update condition.
 
+        Runs as a server-side prepared statement (see insert_data).
+
         Returns: None
 
         Example:
         - Updates Alice's age to 31
             update_data("users", {"age": 31}, "name", "Alice")
         """
+        update_query = _update_statement(table, tuple(update_data.keys()), where_constraint_column)
+        data_to_update = tuple(update_data.values()) + (where_constraint_data,)
         try:
-            self.open_connection()
-            set_clause = ", ".join([f"{key} = %s" for key in update_data.keys()])
-            update_query = f"UPDATE {table} SET {set_clause} WHERE {where_constraint_column} = %s"
-            data_to_update = list(update_data.values()) + [where_constraint_data]
-            self.cursor.execute(update_query, data_to_update)
-            self.conn.commit()
+            with self._checkout() as (conn, cursor):
+                self.execute_prepared(cursor, update_query, data_to_update)
+                conn.commit()
         except (OperationalError, DatabaseError) as e:
-            print(f"Error: {e}")
-            self.conn.rollback()
-        finally:
-            self.close_connection()
-
-
-# Initialize the connection pool using centralized configuration
-if config is not None:
-    # Use config module (recommended)
-    db_config = config.database
-    DatabaseConnection.initialize_pool(
-        minconn=db_config.min_connections,
-        maxconn=db_config.max_connections,
-        host=db_config.host,
-        port=db_config.port,
-        database=db_config.name,
-        user=db_config.user,
-        password=db_config.password,
-    )
-else:
-    # Fallback to environment variables only (legacy support)
-    DatabaseConnection.initialize_pool(
-        minconn=int(os.getenv("DB_MIN_CONN", "5")),
-        maxconn=int(os.getenv("DB_MAX_CONN", "20")),
-        host=os.getenv("DB_HOST", "localhost"),
-        port=int(os.getenv("DB_PORT", "5432")),
-        database=os.getenv("DB_NAME", "trading"),
-        user=os.getenv("DB_USER", "postgres"),
-        password=os.getenv("DB_PASSWORD", ""),
-    )
+            LOGGER.error("Update of %s failed: %s", table, e)
+
+    def update_many(
+        self,
+        table: str,
+        update_columns: tuple[str, ...],
+        where_constraint_column: str,
+        rows: list[tuple],
+        page_size: int = 1000,
+    ):
+        """
+        Update many rows of the specified table in a single statement.
+
+        Parameters:
+        - table (str): Name of the table to update.
+        - update_columns (tuple): Column names to be updated.
+        - where_constraint_column (str): The column used to match each row.
+        - rows (list): Tuples of (where_constraint_data, *new values in update_columns order).
+        - page_size (int): Maximum number of rows per generated statement.
+
+        Returns: None
+
+        Example:
+        - Updates Alice's and Bob's ages
+            update_many("users", ("age",), "name", [("Alice", 31), ("Bob", 26)])
+        """
+        if not rows:
+            return
+        # pylint: disable=import-outside-toplevel
+        from psycopg2.extras import execute_values
+
+        update_query = _update_many_statement(table, tuple(update_columns), where_constraint_column)
+        try:
+            with self._checkout() as (conn, cursor):
+                execute_values(cursor, update_query, rows, page_size=page_size)
+                conn.commit()
+        except (OperationalError, DatabaseError) as e:
+            LOGGER.error("Bulk update of %s failed: %s", table, e)
+
+
+# Shared instances: operations hold no state, so every module imports these
+# instead of creating its own
+INSERT_DATA = InsertData()
+RETRIEVE = RetrieveData()
+UPDATE_DATA = UpdateData()
 
 # Cleanup when the application stops
 atexit.register(DatabaseConnection.close_pool)
@@ -313,6 +863,7 @@ if __name__ == "__main__":
     try:
         # Test 1: Check if connection pool is initialized
         print("\n[Test 1] Checking if connection pool is initialized...")
+        DatabaseConnection._ensure_pool()  # pylint: disable=protected-access
         if DatabaseConnection.connection_pool is not None:
             print("✓ Connection pool initialized successfully")
         else:
@@ -343,9 +894,8 @@ if __name__ == "__main__":
         try:
             # This will fail if the table doesn't exist,
             # but that's okay - we're just testing the connection
-            retriever.open_connection()
-            print("✓ RetrieveData connection opened successfully")
-            retriever.close_connection()
+            with retriever._checkout():  # pylint: disable=protected-access
+                print("✓ RetrieveData connection opened successfully")
             print("✓ RetrieveData connection closed successfully")
         except (OperationalError, DatabaseError) as e:
             print(f"⚠  RetrieveData test encountered an issue: {e}")
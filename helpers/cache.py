@@ -0,0 +1,285 @@
+"""
+Cache Utilities Module
+
+This module provides small caches used to avoid repeating slow network and database lookups.
+
+Classes:
+    FileCache: JSON-file cache with per-entry expiry, persisted across runs
+    TTLCache: Thread-safe in-memory cache with a fixed time-to-live
+    ResponseCache: In-memory cache of API responses that can serve stale data on failure
+    SingleFlight: Collapses concurrent identical calls into one
+
+Functions:
+    cached_response: Decorator caching a client's request method in a ResponseCache
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Default cache location: <project root>/.cache
+CACHE_ROOT = Path(__file__).resolve().parent.parent / ".cache"
+
+
+class FileCache:
+    """
+    Persistent key/value cache stored as one JSON file per key
+
+    Each file holds {"ts": <write time>, "ttl": <seconds>, "value": <value>}. Entries
+    older than their TTL are treated as missing. Values must be JSON-serializable.
+    Writes go through a temporary file and os.replace, so concurrent readers never
+    see a partially written entry.
+    """
+
+    def __init__(self, namespace: str, default_ttl: float, root: Optional[Path] = None) -> None:
+        """
+        Parameters:
+            namespace (str): Sub-directory of the cache root for this cache
+            default_ttl (float): Seconds an entry stays valid unless set() overrides it
+            root (Path): Cache root directory (defaults to <project root>/.cache)
+        """
+        self.directory = (root or CACHE_ROOT) / namespace
+        self.default_ttl = default_ttl
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.md5(key.encode("utf-8"), usedforsecurity=False).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if missing, expired or unreadable
+        """
+        try:
+            with self._path(key).open("r", encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return default
+        try:
+            if time.time() - entry["ts"] > entry["ttl"]:
+                return default
+            return entry["value"]
+        except (KeyError, TypeError):
+            return default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key (best effort: I/O errors are ignored)
+        """
+        entry = {
+            "ts": time.time(),
+            "ttl": self.default_ttl if ttl is None else ttl,
+            "value": value,
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(entry, tmp_file)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for key if present"""
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache whose entries expire after a fixed number of seconds
+
+    Expiry uses time.monotonic(), so wall-clock changes do not affect it. Expired
+    entries are swept out by set() at most once per ttl, so keys that are never
+    read again do not accumulate.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        Parameters:
+            ttl (float): Seconds an entry stays valid after it is set
+        """
+        self.ttl = ttl
+        self._entries: dict[Any, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._next_purge = time.monotonic() + ttl
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            return default
+        return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store value under key, sweeping out expired entries when a purge is due"""
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_purge:
+                self._entries = {
+                    k: entry for k, entry in self._entries.items() if now - entry[0] <= self.ttl
+                }
+                self._next_purge = now + self.ttl
+            self._entries[key] = (now, value)
+
+    def invalidate(self, key: Any = None) -> None:
+        """Drop the entry for key, or every entry when key is None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+# Freshness of cached API responses, in seconds, by policy name
+RESPONSE_TTL_POLICIES = {"short": 5, "normal": 15, "long": 45}
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory cache of API responses
+
+    Entries are fresh for the TTL of the policy used to read them. Older entries are
+    kept for up to max_stale seconds so a failed request can fall back to them.
+    """
+
+    def __init__(self, max_stale: float = 300) -> None:
+        """
+        Parameters:
+            max_stale (float): Seconds an entry can still be served after a failed request
+        """
+        self.max_stale = max_stale
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, max_age: float, default: Any = None) -> Any:
+        """Return the value for key if it is at most max_age seconds old, else default"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > max_age:
+            return default
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, dropping entries too old to be served even as stale"""
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now, value)
+            expired = [k for k, (ts, _) in self._entries.items() if now - ts > self.max_stale]
+            for expired_key in expired:
+                del self._entries[expired_key]
+
+    def invalidate(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+
+RESPONSE_CACHE = ResponseCache()
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time
+
+    A caller arriving while a call with the same key is in progress waits for that
+    call and receives its result (or exception) instead of making its own.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Return func(), sharing the call with concurrent callers using the same key
+
+        Parameters:
+            key (str): Identity of the call
+            func (Callable): Zero-argument function performing the call
+
+        Returns:
+            Any: Result of the (possibly shared) call
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(func())
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
+
+
+# Identical requests in progress at the same time share one network call
+RESPONSE_SINGLE_FLIGHT = SingleFlight()
+
+
+def cached_response(policy: str = "short", cache: Optional[ResponseCache] = None) -> Callable:
+    """
+    Cache the results of an API client's request method
+
+    The cache key is the client class name plus the call arguments, so identical
+    requests made within the policy's TTL (see RESPONSE_TTL_POLICIES) share one
+    response, and identical requests made concurrently share one call. When the
+    request fails with an I/O error (requests exceptions are OSErrors), a stale
+    response up to cache.max_stale seconds old is returned instead; without one the
+    error is raised as before.
+
+    Parameters:
+        policy (str): Name of the TTL policy ("short", "normal" or "long")
+        cache (ResponseCache): Cache to use (defaults to the shared RESPONSE_CACHE)
+
+    Returns:
+        Callable: Method decorator
+    """
+    ttl = RESPONSE_TTL_POLICIES[policy]
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            store = cache or RESPONSE_CACHE
+            key = json.dumps(
+                [type(self).__name__, method.__name__, args, kwargs], sort_keys=True, default=str
+            )
+            value = store.get(key, ttl, _MISSING)
+            if value is not _MISSING:
+                return value
+            try:
+                value = RESPONSE_SINGLE_FLIGHT.do(key, lambda: method(self, *args, **kwargs))
+            except OSError:
+                stale = store.get(key, store.max_stale, _MISSING)
+                if stale is _MISSING:
+                    raise
+                return stale
+            store.set(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -8,16 +8,153 @@ Classes:
     DBHelpers: Database helper functions for retrieving tickers and UUIDs from market tables
 """
 
-from datetime import datetime
-from decimal import Decimal
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
 from typing import Optional
 
-import requests
+from db.scanners_db import RETRIEVE, UPDATE_DATA
+
+from .cache import FileCache, TTLCache
+from .http import build_session, parse_json
+
+__all__ = ["Helpers", "DBHelpers"]
+
+YAHOO_SEARCH_URL = "https://query2.finance.yahoo.com/v1/finance/search"
+YAHOO_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
+    )
+}
+
+# Corporate suffixes ignored when shortening a company name (compared lower-cased)
+_COMPANY_SUFFIXES = frozenset({"corp", "corporation", "inc", "plc", "ltd"})
+
+# Shared HTTP session so connections are reused across calls and lookup threads
+# (Yahoo headers by default, SEC requests override the User-Agent)
+SEARCH_WORKERS = 16
+SESSION = build_session(pool_maxsize=SEARCH_WORKERS, headers=YAHOO_HEADERS)
+
+SEC_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+SEC_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15"
+    )
+}
+
+
+# On-disk caches shared across runs: company name searches rarely change,
+# the SEC ticker list is refreshed daily
+YAHOO_SEARCH_CACHE = FileCache("yahoo_search", default_ttl=30 * 24 * 3600)
+# Searches that found nothing are only remembered briefly: a newly listed company
+# may not be indexed by Yahoo yet
+YAHOO_SEARCH_MISS_TTL = 15 * 60
+SEC_TICKERS_CACHE = FileCache("sec_tickers", default_ttl=24 * 3600)
+_NOT_CACHED = object()
+
+# Valid markets and their corresponding table names
+_TICKER_MARKETS = {
+    None: "equities.stock_data",
+    "pre_market": "pre_market.pre_market_scanner",
+    "regular_market": "regular_market.regular_market_scanner",
+    "after_market": "after_market.after_market_scanner",
+}
+_UUID_MARKETS = {
+    "equities": "equities.stock_data",
+    "pre_market": "pre_market.pre_market_scanner",
+    "regular_market": "regular_market.regular_market_scanner",
+    "after_market": "after_market.after_market_scanner",
+}
+# Market names listed in error messages
+_TICKER_MARKETS_KEYS = list(_TICKER_MARKETS.keys())[1:]
+_UUID_MARKETS_KEYS = list(_UUID_MARKETS.keys())
+
+# Ticker lists per table change slowly intraday; callers that add tickers invalidate
+TICKERS_CACHE = TTLCache(ttl=300)
+
+# Numeric timestamps at or above this value are treated as milliseconds
+MILLISECONDS_THRESHOLD = 1e12
+
+# Timestamps are converted in UTC: no local-time lookup per call. The result is naive
+# (UTC wall time), matching the TIMESTAMP WITHOUT TIME ZONE short data columns
+_UTC = timezone.utc
+
+
+def _load_sec_ticker_map() -> dict[str, int]:
+    """
+    Load the SEC company list indexed by ticker
+
+    SEC_TICKERS_CACHE is the only cache: the index is read from it while it is less
+    than a day old, otherwise downloaded again, so long-running scanners pick up
+    newly listed tickers. Bulk callers load it once per batch.
+
+    Returns:
+        dict: Mapping of ticker symbol to CIK number
+    """
+    ticker_map = SEC_TICKERS_CACHE.get(SEC_COMPANY_TICKERS_URL)
+    if ticker_map is not None:
+        return ticker_map
+
+    tickers_json = parse_json(
+        SESSION.get(
+            url=SEC_COMPANY_TICKERS_URL,
+            headers=SEC_HEADERS,
+            timeout=30,
+        )
+    )
+    ticker_map = {company["ticker"]: company["cik_str"] for company in tickers_json.values()}
+    SEC_TICKERS_CACHE.set(SEC_COMPANY_TICKERS_URL, ticker_map)
+    return ticker_map
+
 
-from db.scanners_db import RetrieveData, UpdateData
+def _resolve_ciks_from_sec(tickers: list[str]) -> dict[str, Optional[str]]:
+    """
+    Look tickers up in the SEC company list and store the CIK numbers found
+
+    Parameters:
+        tickers (list): Ticker symbols without a stored CIK number (any case)
 
-RETRIEVE = RetrieveData()
-UPDATE_DATA = UpdateData()
+    Returns:
+        dict: Mapping of each ticker, as given, to its CIK number
+            (None if the SEC list has no match)
+    """
+    sec_map = _load_sec_ticker_map()
+    cik_map = {}
+    resolved = []
+    for ticker in tickers:
+        cik = sec_map.get(ticker.upper())
+        cik_map[ticker] = str(cik) if cik is not None else None
+        if cik is not None:
+            resolved.append((ticker.upper(), str(cik)))
+    UPDATE_DATA.update_many(
+        table="equities.stock_data",
+        update_columns=("cik_number",),
+        where_constraint_column="ticker",
+        rows=resolved,
+    )
+    return cik_map
+
+
+def _search_yahoo_symbol(query: str) -> Optional[str]:
+    """Return the first symbol Yahoo Finance search finds for the query, if any"""
+    cached = YAHOO_SEARCH_CACHE.get(query, _NOT_CACHED)
+    if cached is not _NOT_CACHED:
+        return cached
+
+    res = SESSION.get(
+        url=YAHOO_SEARCH_URL,
+        params={"q": query},
+        timeout=30,
+    )
+    data = parse_json(res)
+
+    try:
+        symbol = data["quotes"][0]["symbol"]
+    except (KeyError, IndexError):
+        symbol = None
+    YAHOO_SEARCH_CACHE.set(query, symbol, ttl=None if symbol else YAHOO_SEARCH_MISS_TTL)
+    return symbol
 
 
 class Helpers:
@@ -51,42 +188,21 @@ class Helpers:
         if not company_name:
             return None
 
-        # Helper to search and extract ticker symbols
-        def get_tickers(company_name):
-            yfinance = "https://query2.finance.yahoo.com/v1/finance/search"
-            user_agent = (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
-            )
-            params = {"q": company_name}
-            res = requests.get(
-                url=yfinance,
-                params=params,
-                headers={"User-Agent": user_agent},
-                timeout=30,
-            )
-            data = res.json()
-
-            try:
-                return data["quotes"][0]["symbol"]
-            except IndexError:
-                return None
-
         # First try with the full name
-        tickers = get_tickers(company_name=company_name)
+        tickers = _search_yahoo_symbol(company_name)
         if tickers:
             return tickers
 
-        # Try shorter variations by removing common suffixes
-        suffixes = ["Corp", "Corporation", "Inc", "PLC", "Plc", "Ltd"]
+        # Drop trailing corporate suffixes once, then try progressively shorter names
         name_parts = company_name.split()
+        while name_parts and name_parts[-1].lower().rstrip(".,") in _COMPANY_SUFFIXES:
+            name_parts.pop()
         while name_parts:
-            if name_parts[-1] in suffixes:
-                name_parts.pop()  # Remove suffix
             query = " ".join(name_parts)
-            tickers = get_tickers(query)
-            if tickers:
-                return tickers
+            if query != company_name:  # The full name was already tried above
+                tickers = _search_yahoo_symbol(query)
+                if tickers:
+                    return tickers
             name_parts.pop()  # Try with one less word each time
 
         return None
@@ -145,34 +261,25 @@ class Helpers:
 
         Returns:
             str: timestamp type.
-            datetime: A readable date and time.
+            datetime: A readable, naive date and time in UTC.
         """
-        # Convert the timestamp to a string to check its length
         if timestamp is None:
             return None
+        if resultado not in ("date", "type"):
+            msg = "Invalid value for 'resultado'. Choose 'date' or 'type'."
+            raise ValueError(msg)
 
-        timestamp_str = str(timestamp)
-
-        # Determine the type of timestamp and convert accordingly
-        if len(timestamp_str) == 10:
-            # It's a Unix timestamp (seconds)
-            date_time = datetime.fromtimestamp(timestamp)
-            timestamp_type = "Unix timestamp (seconds)"
-        elif len(timestamp_str) == 13:
-            # It's a timestamp in milliseconds
-            timestamp_s = timestamp / 1000.0
-            date_time = datetime.fromtimestamp(timestamp_s)
-            timestamp_type = "Timestamp in milliseconds"
-        else:
-            raise ValueError("Unknown timestamp format")
+        # Classify by magnitude: anything from 1e12 up is milliseconds
+        # (1e12 ms is 2001-09-09; second-based values stay below it for millennia)
+        timestamp = float(timestamp)
+        is_milliseconds = timestamp >= MILLISECONDS_THRESHOLD
 
-        # Return the readable date and time
-        if resultado == "date":
-            return date_time
         if resultado == "type":
-            return timestamp_type
-        msg = "Invalid value for 'resultado'. Choose 'date' or 'type'."
-        raise ValueError(msg)
+            return "Timestamp in milliseconds" if is_milliseconds else "Unix timestamp (seconds)"
+
+        # Return the readable date and time
+        seconds = timestamp / 1000.0 if is_milliseconds else timestamp
+        return datetime.fromtimestamp(seconds, tz=_UTC).replace(tzinfo=None)
 
     def convert_percentage_to_numeric(self, percentage_str):
         """
@@ -192,7 +299,7 @@ class Helpers:
 
         return numeric_value
 
-    def convert_string_to_numeric(self, value):
+    def convert_string_to_numeric(self, value, precise: bool = False):
         """
         Convert string values to appropriate numeric types
 
@@ -200,20 +307,21 @@ class Helpers:
 
         Parameters:
             value (str): String value to convert (e.g., "25%", "3.14", "42")
+            precise (bool): If True, return decimal strings as Decimal instead of float
 
         Returns:
             float | Decimal | int | None: Converted numeric value, or None if conversion fails
         """
         try:
-            if "%" in value:
+            if value.endswith("%"):
                 # Handle percentage strings
-                return float(value.strip("%")) / 100
+                return float(value[:-1]) / 100
             if "." in value:
                 # Handle decimal strings
-                return Decimal(value)
+                return Decimal(value) if precise else float(value)
             # Handle integer strings
             return int(value)
-        except ValueError as e:
+        except (ValueError, InvalidOperation) as e:
             print(f"Error converting value: {e}")
             return None
 
@@ -233,48 +341,21 @@ class Helpers:
             None: Returns None if the ticker is not found or
                 if there is an issue fetching or parsing the data.
         """
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15"
-            )
-        }
-        tickers_json = requests.get(
-            url="https://www.sec.gov/files/company_tickers.json",
-            headers=headers,
-            timeout=30,
-        ).json()
-        for company in tickers_json.values():
-            if company["ticker"] == ticker:
-                return company["cik_str"]
-        return None
+        return _load_sec_ticker_map().get(ticker.upper())
 
     def _get_and_update_cik(self, stock_ticker: str):
-        # Retrieve cik_number from the database for the given market
-        cik_number = RETRIEVE.retrieve_data(
-            table_name="equities.stock_data",
+        # Stored CIK first (one indexed row at most), else SEC list + DB update
+        row = RETRIEVE.retrieve_data(
             column="cik_number",
+            table_name="equities.stock_data",
             condition_column="ticker",
-            condition_value=stock_ticker,
+            condition_value=stock_ticker.upper(),
+            fetch_all=False,
+            limit=1,
         )
-
-        # If cik_number exists, return it
-        if cik_number[0][0] is not None:
-            return cik_number[0][0]
-
-        # If cik_number does not exist, fetch it and update the database
-        cik_number = self._get_cik(ticker=stock_ticker)
-
-        # Update cik_number in the database for the given market
-        update_data_params = {"cik_number": cik_number}
-        UPDATE_DATA.update_data(
-            table="equities.stock_data",
-            update_data=update_data_params,
-            where_constraint_column="ticker",
-            where_constraint_data=stock_ticker,
-        )
-
-        return cik_number
+        if row and row[0] is not None:
+            return row[0]
+        return _resolve_ciks_from_sec([stock_ticker]).get(stock_ticker)
 
     def cik_number(self, stock_ticker: str, search_ticker: bool = False):
         """Looking for CIK Number"""
@@ -304,6 +385,7 @@ class DBHelpers:
     def get_tickers_in_db(self, market: Optional[str] = None) -> list:
         """
         Retrieve the list of tickers from the specified market's database table.
+        Results are cached for five minutes (see invalidate_tickers_cache).
 
         Args:
             market (str, optional): The market category. Options are "pre_market",
@@ -315,28 +397,64 @@ class DBHelpers:
         Raises:
             ValueError: If the market name is invalid.
         """
-        # Define valid markets and their corresponding table names
-        valid_markets = {
-            None: "equities.stock_data",
-            "pre_market": "pre_market.pre_market_scanner",
-            "regular_market": "regular_market.regular_market_scanner",
-            "after_market": "after_market.after_market_scanner",
-        }
-
         # Validate the market and retrieve the table name
-        table_name = valid_markets.get(market)
+        table_name = _TICKER_MARKETS.get(market)
         if table_name is None and market is not None:
             msg_value_error = (
-                f"Invalid market: {market}. "
-                f"Must be one of {list(valid_markets.keys())[1:]} or None."
+                f"Invalid market: {market}. Must be one of {_TICKER_MARKETS_KEYS} or None."
             )
             raise ValueError(msg_value_error)
 
-        # Retrieve tickers from the database
-        data = RETRIEVE.retrieve_data(column="ticker", table_name=table_name)
+        # Serve from the cache while it is fresh
+        tickers = TICKERS_CACHE.get(table_name)
+        if tickers is not None:
+            return tickers
+
+        # Retrieve tickers from the database, aggregated into one array by the server
+        tickers = RETRIEVE.retrieve_array(table_name=table_name, column="ticker")
+        if tickers:
+            # An empty result may be a failed query, so it is not cached
+            TICKERS_CACHE.set(table_name, tickers)
+        return tickers
+
+    def invalidate_tickers_cache(self, table_name: Optional[str] = None) -> None:
+        """
+        Forget the cached ticker list of a table after tickers were inserted into it.
+
+        Args:
+            table_name (str, optional): Table whose list changed, or None to clear all.
+        """
+        TICKERS_CACHE.invalidate(table_name)
+
+    def get_cik_map(self, tickers: list[str]) -> dict[str, Optional[str]]:
+        """
+        Retrieve CIK numbers for several tickers at once.
+
+        Stored CIK numbers are read with one query. Tickers without one are resolved
+        from the SEC company list and written back with one bulk update.
+
+        Args:
+            tickers (list): Ticker symbols to look up (case-insensitive).
 
-        # Return the list of tickers
-        return [row[0] for row in data]
+        Returns:
+            dict: Mapping of each ticker, as given, to its CIK number
+                (None if the SEC list has no match).
+        """
+        if not tickers:
+            return {}
+
+        rows = RETRIEVE.execute_custom_query(
+            "SELECT ticker, cik_number FROM equities.stock_data WHERE ticker = ANY(%s)",
+            ([ticker.upper() for ticker in tickers],),
+        )
+        stored = {ticker: cik for ticker, cik in rows if cik is not None}
+        cik_map = {ticker: stored[ticker.upper()] for ticker in tickers if ticker.upper() in stored}
+
+        missing = [ticker for ticker in tickers if ticker not in cik_map]
+        if missing:
+            cik_map.update(_resolve_ciks_from_sec(missing))
+
+        return cik_map
 
     def get_uuid(self, ticker: str, market: str) -> str:
         """
@@ -354,24 +472,13 @@ class DBHelpers:
             ValueError: If the market name is invalid.
             LookupError: If no UUID is found for the ticker.
         """
-
-        # Define valid markets and corresponding table names
-        valid_markets = {
-            "equities": "equities.stock_data",
-            "pre_market": "pre_market.pre_market_scanner",
-            "regular_market": "regular_market.regular_market_scanner",
-            "after_market": "after_market.after_market_scanner",
-        }
-
         # Validate the market
-        if market not in valid_markets:
-            msg_value_error = (
-                f"Invalid market: {market}. Must be one of {list(valid_markets.keys())}."
-            )
+        if market not in _UUID_MARKETS:
+            msg_value_error = f"Invalid market: {market}. Must be one of {_UUID_MARKETS_KEYS}."
             raise ValueError(msg_value_error)
 
         # Fetch the table name based on the market
-        table_name = valid_markets[market]
+        table_name = _UUID_MARKETS[market]
 
         # Retrieve the UUID
         uuid_raw = RETRIEVE.retrieve_data(
@@ -379,6 +486,7 @@ class DBHelpers:
             table_name=table_name,
             condition_column="ticker",
             condition_value=ticker,
+            limit=1,
         )
 
         # Handle cases where no UUID is found
@@ -0,0 +1,182 @@
+"""
+HTTP Utilities Module
+
+This module provides a factory for pooled, retrying requests sessions shared by
+the API clients, scrapers and helpers.
+
+Functions:
+    build_session: Create a requests.Session with connection pooling and retries
+    build_http2_client: Create an HTTP/2 httpx.Client when available, else a session
+    parse_json: Decode a JSON response body, using orjson when it is installed
+
+Classes:
+    TokenBucket: Client-side rate limiter pacing requests to a provider's quota
+"""
+
+import threading
+import time
+from typing import Any, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import h2  # pylint: disable=unused-import
+    import httpx
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    # httpx[http2] is optional: fall back to a pooled requests session (HTTP/1.1)
+    httpx = None
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson is optional: fall back to requests' stdlib-based decoding
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Transient statuses worth retrying (rate limiting and server-side errors)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Errors raised by clients from build_session/build_http2_client once their retries
+# are exhausted (requests exceptions are OSErrors; httpx has its own hierarchy)
+TRANSPORT_ERRORS: tuple[type[Exception], ...] = (OSError,) + (
+    (httpx.HTTPError,) if HTTP2_AVAILABLE else ()
+)
+
+
+def build_session(
+    pool_maxsize: int = 10,
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    headers: Optional[Mapping[str, str]] = None,
+) -> requests.Session:
+    """
+    Create a requests session that reuses connections and retries transient failures
+
+    Retries honour Retry-After headers. Once they are exhausted the last response is
+    returned rather than raised, so callers keep handling status codes themselves.
+
+    Parameters:
+        pool_maxsize (int): Connections kept per host (match the number of threads using it)
+        retries (int): Maximum retries for connection errors and RETRY_STATUS_CODES
+        backoff_factor (float): Exponential backoff factor between retries, in seconds
+        headers (Mapping): Headers sent with every request made through the session
+
+    Returns:
+        requests.Session: Configured session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def build_http2_client(
+    pool_maxsize: int = 16,
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Any:
+    """
+    Create a client that multiplexes concurrent requests over HTTP/2
+
+    Returns an httpx.Client when httpx and h2 are installed, otherwise a session
+    from build_session. Both expose get/post with the same arguments and responses
+    with status_code, text, content and json(). The httpx client retries failed
+    connections only, not error statuses.
+
+    Parameters:
+        pool_maxsize (int): Maximum number of open connections
+        retries (int): Retries for failed connection attempts
+        backoff_factor (float): Backoff between retries of the requests fallback, in seconds
+        headers (Mapping): Headers sent with every request made through the client
+
+    Returns:
+        httpx.Client | requests.Session: Configured client
+    """
+    if not HTTP2_AVAILABLE:
+        return build_session(
+            pool_maxsize=pool_maxsize,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            headers=headers,
+        )
+    limits = httpx.Limits(max_connections=pool_maxsize * 2, max_keepalive_connections=pool_maxsize)
+    return httpx.Client(
+        headers=headers,
+        transport=httpx.HTTPTransport(http2=True, limits=limits, retries=retries),
+    )
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode the JSON body of a response
+
+    Uses orjson on the raw bytes when available (noticeably faster on large quote
+    payloads), otherwise response.json().
+
+    Parameters:
+        response (requests.Response): Response with a JSON body
+
+    Returns:
+        Any: Decoded JSON value
+
+    Raises:
+        ValueError: If the body is not valid JSON (orjson.JSONDecodeError and
+            requests' JSONDecodeError both subclass it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket pacing requests to a per-minute quota
+
+    The bucket starts full (allowing a burst of `capacity` requests) and refills
+    continuously at requests_per_minute / 60 tokens per second. acquire() blocks
+    until enough tokens are available.
+    """
+
+    def __init__(self, requests_per_minute: float, capacity: Optional[float] = None) -> None:
+        """
+        Parameters:
+            requests_per_minute (float): Sustained request rate allowed
+            capacity (float): Largest burst allowed (defaults to one minute of requests)
+        """
+        self.rate = requests_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else float(requests_per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Take tokens from the bucket, sleeping until they have been refilled"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_seconds = (tokens - self._tokens) / self.rate
+            time.sleep(wait_seconds)
@@ -39,39 +39,34 @@ License: See LICENSE file
 Version: See __version__.py
 """
 
-import platform
+import argparse
+import json
+import os
 import signal
 import sys
+import threading
 import time
+from pathlib import Path
 
 from __version__ import __version__
-from config import config, validate_config
+from config import configure_logging, get_config, validate_config
 from scanner.config import MarketType
 from scanner.executor import start_scanner_thread, stop_all_scanners
 from scanner.utilities import Searching
 
+# Consent to the Terms of Service warning, remembered per application version
+CONSENT_FILE = Path.home() / ".config" / "small_caps_scanner" / "consent.json"
 
-def searching_ticker(stock_ticker: str):
-    """
-    General information of a publicly traded company
-    """
-    search_stock = Searching(stock_ticker=stock_ticker)
-    search_stock.search_stock()
+# Set by the signal handler; the main thread waits on it instead of signal.pause()
+shutdown_event = threading.Event()
 
-
-def signal_handler():
-    """Handle SIGINT (Ctrl+C) to stop all scanners gracefully."""
-    print("\nStopping all scanners...")
-    stop_all_scanners()
-    sys.exit(0)
+# Signals arriving within this many seconds of the previous one are ignored
+SIGNAL_DEBOUNCE_SECONDS = 0.1
+_last_signal_time = float("-inf")
 
 
-def display_tos_warning_and_get_consent():
-    """
-    Display Terms of Service warning and require explicit user consent.
-    Returns True if user consents, False otherwise.
-    """
-    warning_message = """
+# Terms of Service warning, encoded once at import time
+TOS_WARNING = """
 ╔═══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                               ║
 ║                     ⚠️  CRITICAL LEGAL WARNING ⚠️                             ║
@@ -125,8 +120,70 @@ BY TYPING 'I AGREE' BELOW, YOU ACKNOWLEDGE THAT:
 
 ═══════════════════════════════════════════════════════════════════════════════
 """
+TOS_WARNING_BYTES = (TOS_WARNING + "\n").encode("utf-8")
+
 
-    print(warning_message)
+def searching_ticker(stock_ticker: str):
+    """
+    General information of a publicly traded company
+    """
+    search_stock = Searching(stock_ticker=stock_ticker)
+    search_stock.search_stock()
+
+
+def signal_handler(signum=None, frame=None):  # pylint: disable=unused-argument
+    """
+    Handle SIGINT (Ctrl+C) and SIGTERM by requesting a shutdown.
+
+    Only flips the shutdown event; the main thread stops the scanners. Duplicate
+    signals (e.g. a terminal sending SIGINT twice) are coalesced.
+    """
+    global _last_signal_time  # pylint: disable=global-statement
+    now = time.monotonic()
+    if now - _last_signal_time < SIGNAL_DEBOUNCE_SECONDS:
+        return
+    _last_signal_time = now
+    shutdown_event.set()
+
+
+def has_recorded_consent() -> bool:
+    """Return True if consent was already given for the running version."""
+    try:
+        with CONSENT_FILE.open("r", encoding="utf-8") as consent_file:
+            return json.load(consent_file).get("version") == __version__
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def record_consent():
+    """Remember consent for the running version (best effort)."""
+    try:
+        CONSENT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CONSENT_FILE.write_text(json.dumps({"version": __version__}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def display_tos_warning_and_get_consent(reset_consent: bool = False):
+    """
+    Display Terms of Service warning and require explicit user consent.
+    Returns True if user consents, False otherwise.
+
+    Consent is remembered for the current version, so the prompt is only shown
+    again after an upgrade or when reset_consent is True.
+    """
+    if not reset_consent and has_recorded_consent():
+        return True
+
+    # Write the pre-encoded bytes when stdout is a UTF-8 text stream
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    stdout_encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "")
+    if stdout_buffer is not None and stdout_encoding == "utf8":
+        sys.stdout.flush()
+        stdout_buffer.write(TOS_WARNING_BYTES)
+        stdout_buffer.flush()
+    else:
+        print(TOS_WARNING)
     print("\nTo continue, type 'I AGREE' (case-sensitive) and press Enter.")
     print("To exit, type anything else or press Ctrl+C.\n")
 
@@ -134,8 +191,16 @@ BY TYPING 'I AGREE' BELOW, YOU ACKNOWLEDGE THAT:
         user_input = input("Your response: ").strip()
 
         if user_input == "I AGREE":
+            record_consent()
             print("\n✓ Consent recorded. Starting scanners...\n")
-            time.sleep(2)  # Give user time to read the confirmation
+            # Optional pause to read the confirmation (interactive terminals only)
+            try:
+                pause_seconds = float(os.getenv("CONSENT_PAUSE_SECONDS", "0") or 0)
+            except ValueError:
+                # A malformed value only disables the pause
+                pause_seconds = 0
+            if pause_seconds > 0 and sys.stdout.isatty():
+                time.sleep(pause_seconds)
             return True
         print("\n✗ Consent not provided. Exiting for your legal protection.")
         print("Consider using the official API integrations instead (see README.md).\n")
@@ -148,6 +213,14 @@ BY TYPING 'I AGREE' BELOW, YOU ACKNOWLEDGE THAT:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Small Caps Stock Market Scanner")
+    parser.add_argument(
+        "--reset-consent",
+        action="store_true",
+        help="Show the Terms of Service warning again even if consent was recorded",
+    )
+    args = parser.parse_args()
+
     # Display version
     print(f"Stock Market Scanner v{__version__}")
     print("=" * 50)
@@ -157,10 +230,11 @@ if __name__ == "__main__":
     print("Validating configuration...")
     try:
         validate_config(require_schwab=True)
+        configure_logging()
         print("✓ Configuration is valid\n")
 
         # Print configuration summary
-        config.print_summary()
+        get_config().print_summary()
         print()
 
     except ValueError as e:
@@ -170,14 +244,15 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Display Terms of Service warning and get explicit consent
-    if not display_tos_warning_and_get_consent():
+    if not display_tos_warning_and_get_consent(reset_consent=args.reset_consent):
         sys.exit(0)
 
-    # Set up signal handler for graceful shutdown
+    # Set up signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
 
     # Use configured sleep time
-    sleep_time = config.app.sleep_time
+    sleep_time = get_config().app.sleep_time
 
     """Start scanner"""
     # ============================================================================
@@ -214,18 +289,13 @@ if __name__ == "__main__":
     print("    Monitor for HTTP 403/429 errors and stop immediately if blocked.")
     print("\nℹ️  NOTE: After-market scanner is currently under development and disabled.\n")
 
-    # Keep the main thread alive (cross-platform solution)
-    # signal.pause() is only available on Unix systems
-    if platform.system() == "Windows":
-        # On Windows, use a loop with sleep to keep the main thread alive
-        try:
-            while True:
-                time.sleep(1)
-        except (KeyboardInterrupt, TypeError):
-            signal_handler()
-    else:
-        # On Unix systems, use signal.pause()
-        signal.pause()  # pylint: disable=no-member
+    # Keep the main thread alive until a signal handler sets the shutdown event
+    # (waits in short slices so Ctrl+C is also delivered promptly on Windows)
+    while not shutdown_event.wait(timeout=1):
+        pass
+
+    print("\nStopping all scanners...")
+    stop_all_scanners()
 
     # Search for a specific stock ticker
     # stock_ticker = ''
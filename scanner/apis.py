@@ -14,24 +14,68 @@ This module contains:
 import base64
 import logging
 import os
+import re
+import threading
 import uuid
 import webbrowser
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
 
 import requests
 import yfinance as yf
 
 # Polygon API
 from polygon import RESTClient
-from polygon.rest.models import TickerSnapshot
 
-from db.scanners_db import InsertData, RetrieveData
+from db.scanners_db import INSERT_DATA, RETRIEVE
+from helpers.cache import TTLCache, cached_response
 from helpers.helpers import Helpers
+from helpers.http import TokenBucket, build_http2_client, build_session, parse_json
 
 # Log configuration
 LOGGER = logging.getLogger(__name__)
 
+# One pooled client for every SchwabAPI instance: the scanner creates an instance
+# per ticker, so a per-instance client would never reuse connections. HTTP/2 (one
+# multiplexed connection) when httpx[http2] is installed, else a retrying session
+SCHWAB_SESSION = build_http2_client(pool_maxsize=16, retries=3, backoff_factor=0.2)
+
+# Pooled, retrying session shared by the market data providers below (Alpha Vantage,
+# FMP, Alpaca, Intrinio); credentials are sent per request, not stored on it
+PROVIDER_SESSION = build_session(pool_maxsize=10, retries=5, backoff_factor=0.5)
+
+# Concurrent Schwab requests allowed at once (keeps fan-out under the API rate limit)
+SCHWAB_MAX_CONCURRENT_REQUESTS = 8
+_SCHWAB_REQUEST_SLOTS = threading.BoundedSemaphore(SCHWAB_MAX_CONCURRENT_REQUESTS)
+
+# Latest stored Schwab token row, shared by every instance of this process;
+# dropped whenever a new token is stored, the TTL covers tokens stored elsewhere
+TOKEN_ROW_CACHE = TTLCache(ttl=60)
+_LATEST_TOKEN_COLUMNS = ("time", "expires_in", "refresh_token", "access_token")
+
+# Access token shared by every instance until it nears expiry; the lock makes
+# concurrent scans wait for one refresh (or login) instead of each starting their own
+_SHARED_TOKEN: dict = {}
+_SHARED_TOKEN_LOCK = threading.Lock()
+
+# Authorization code in the URL Schwab redirects to after login (percent-encoded)
+_AUTH_CODE_RE = re.compile(r"[?&]code=([^&#]+)")
+
+# Access tokens are treated as expired this long before their stored expiry time
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+# Fundamentals do not change intraday; quotes are reused only within a few seconds
+FUNDAMENTALS_CACHE = TTLCache(ttl=3600)
+QUOTES_CACHE = TTLCache(ttl=5)
+
+# Polygon's gainers snapshot barely changes between scan cycles
+POLYGON_GAINERS_CACHE = TTLCache(ttl=5)
+
+# Symbols sent per /quotes request when a ticker list is split into batches
+SCHWAB_QUOTES_PER_REQUEST = 100
+
 
 # ============================================================================
 # CHARLES SCHWAB API
@@ -58,42 +102,74 @@ class SchwabAPI:
 
     APP_KEY_SCHWAB = os.getenv("APP_KEY_SCHWAB")
     CLIENT_SECRET_SCHWAB = os.getenv("CLIENT_SECRET_SCHWAB")
+    _BASIC_AUTH_HEADER: Optional[str] = None
 
-    def __init__(self, access_token: Optional[str] = None, stock_ticker: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        stock_ticker: Optional[str] = None,
+        quote_data: Optional[dict] = None,
+    ):
         """
-        Initialize SchwabAPI client, set up authentication and optionally load
-        market data for a given stock ticker
+        Initialize SchwabAPI client and set up authentication. Market data for
+        stock_ticker is fetched lazily, on first access
 
         :param access_token: OAuth access token for Schwab API authentication
         :type access_token: str
         :param stock_ticker: Stock ticker symbol to fetch market data for
         :type stock_ticker: str
+        :param quote_data: Quote of stock_ticker already fetched with quote_many (optional)
+        :type quote_data: dict
         """
         self.schwab_access = "schwab_access.schwab_access_refresh_token"
         self.market_data_base_url = "https://api.schwabapi.com/marketdata/v1"
         self.redirect_uri = "https://127.0.0.1"
-        self.session = requests.Session()
+        self.session = SCHWAB_SESSION
         self.access_token = access_token
         self.token_expiry = None
+        self._quotes_cache: dict = {}
+        self._quote_single_cached: Optional[dict] = None
+        self._stock_fundamental_cached: Optional[dict] = None
 
         # Initialize dependencies
-        self.inserter = InsertData()
-        self.retriever = RetrieveData()
+        self.inserter = INSERT_DATA
+        self.retriever = RETRIEVE
 
         if self.access_token is None:
-            self.access_token, self.token_expiry = self.get_access_token()
+            self.access_token, self.token_expiry = self._shared_access_token()
 
         self.headers = {
             "accept": "application/json",
             "Authorization": f"Bearer {self.access_token}",
         }
 
-        if stock_ticker is not None:
-            self.stock_ticker = stock_ticker
-            self._quote_single = self.quote_single(stock_ticker=self.stock_ticker)
-            self._stock_fundamental = self.stock_fundamental(stock_ticker=self.stock_ticker)
-        else:
-            self.stock_ticker = None
+        self.stock_ticker = stock_ticker
+        if stock_ticker is not None and quote_data is not None:
+            self._quotes_cache[stock_ticker] = quote_data
+            self._quote_single_cached = {stock_ticker: quote_data}
+
+    @property
+    def _quote_single(self) -> dict:
+        """Quote data of the constructor's ticker, fetched on first access"""
+        if self._quote_single_cached is None:
+            self._quote_single_cached = self.quote_single(stock_ticker=self.stock_ticker)
+        return self._quote_single_cached
+
+    @property
+    def _stock_fundamental(self) -> dict:
+        """Fundamental data of the constructor's ticker, fetched on first access"""
+        if self._stock_fundamental_cached is None:
+            self._stock_fundamental_cached = self.stock_fundamental(stock_ticker=self.stock_ticker)
+        return self._stock_fundamental_cached
+
+    @classmethod
+    def _basic_auth_header(cls) -> str:
+        """Basic auth header for the OAuth token endpoint, encoded once per process"""
+        if cls._BASIC_AUTH_HEADER is None:
+            credentials = f"{cls.APP_KEY_SCHWAB}:{cls.CLIENT_SECRET_SCHWAB}"
+            encoded = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+            cls._BASIC_AUTH_HEADER = f"Basic {encoded}"
+        return cls._BASIC_AUTH_HEADER
 
     def get_access_token(self):
         """
@@ -102,45 +178,64 @@ class SchwabAPI:
         Returns:
             Tuple of access token and its expiry time
         """
-        if self.token_expiry and datetime.now() < self.token_expiry:
+        # Same test as _shared_access_token: valid until TOKEN_EXPIRY_MARGIN before expiry
+        if self.token_expiry and self._is_token_valid(self.access_token, self.token_expiry):
             return self.access_token, self.token_expiry
 
-        if self._30_minutes_passed():
-            if self._has_week_passed():
-                self._authenticate()
-                token_data = self._retrieve_latest_token()
-                return token_data["access_token"], token_data["expiry_time"]
-            token_data = self._retrieve_latest_token()
-            if self._is_token_valid(token_data["access_token"]):
-                return token_data["access_token"], token_data["expiry_time"]
-            refreshed_token_data = self._refresh_tokens()
-            if refreshed_token_data:
-                return (
-                    refreshed_token_data["access_token"],
-                    refreshed_token_data["expiry_time"],
-                )
+        if self._has_week_passed():
             self._authenticate()
             token_data = self._retrieve_latest_token()
             return token_data["access_token"], token_data["expiry_time"]
         token_data = self._retrieve_latest_token()
+        if self._is_token_valid(token_data["access_token"], token_data["expiry_time"]):
+            return token_data["access_token"], token_data["expiry_time"]
+        refreshed_token_data = self._refresh_tokens()
+        if refreshed_token_data:
+            return (
+                refreshed_token_data["access_token"],
+                refreshed_token_data["expiry_time"],
+            )
+        self._authenticate()
+        token_data = self._retrieve_latest_token()
         return token_data["access_token"], token_data["expiry_time"]
 
+    def _shared_access_token(self) -> tuple:
+        """
+        Access token and expiry shared across instances, renewed through get_access_token
+        only when it is missing or within TOKEN_EXPIRY_MARGIN of its expiry
+        """
+        with _SHARED_TOKEN_LOCK:
+            expiry_time = _SHARED_TOKEN.get("expiry_time")
+            if expiry_time is None or datetime.now() >= expiry_time - TOKEN_EXPIRY_MARGIN:
+                access_token, expiry_time = self.get_access_token()
+                _SHARED_TOKEN.update(access_token=access_token, expiry_time=expiry_time)
+            return _SHARED_TOKEN["access_token"], _SHARED_TOKEN["expiry_time"]
+
+    def _latest_token_row(self) -> dict:
+        # Newest token row (index on time DESC), cached across instances
+        token_row = TOKEN_ROW_CACHE.get("latest")
+        if token_row is None:
+            row = self.retriever.retrieve_latest(
+                table_name=self.schwab_access, columns=_LATEST_TOKEN_COLUMNS
+            )
+            if row is None:
+                raise LookupError("No Schwab token stored in " + self.schwab_access)
+            token_row = dict(zip(_LATEST_TOKEN_COLUMNS, row))
+            TOKEN_ROW_CACHE.set("latest", token_row)
+        return token_row
+
     def _has_week_passed(self, timestamp_str: Optional[str] = None):
         if timestamp_str is None:
-            data_date = self.retriever.retrieve_data(
-                table_name="schwab_access.schwab_access_refresh_token", column="time"
-            )[-1][0]
+            data_date = self._latest_token_row()["time"]
         else:
             data_date = datetime.fromisoformat(date_string=timestamp_str)
         return (datetime.now() - data_date) >= timedelta(weeks=1)
 
-    def _30_minutes_passed(self) -> bool:
-        data_token = self.retriever.retrieve_data(
-            table_name="schwab_access.schwab_access_refresh_token", column="time"
-        )[-1]
-        return (datetime.now() - data_token[0]) >= timedelta(minutes=30)
-
-    def _is_token_valid(self, access_token: str) -> bool:
+    def _is_token_valid(self, access_token: str, expiry_time: Optional[datetime] = None) -> bool:
+        # Decide from the stored expiry (with a minute of margin) when it is known;
+        # only probe the API when it is not
+        if expiry_time is not None:
+            return datetime.now() < expiry_time - TOKEN_EXPIRY_MARGIN
 
         headers = {
             "accept": "application/json",
@@ -152,12 +247,10 @@ class SchwabAPI:
         return response.status_code == 200
 
     def _retrieve_latest_token(self) -> dict:
-        token_data = self.retriever.retrieve_data(
-            table_name="schwab_access.schwab_access_refresh_token", column="*"
-        )[-1]
+        token_row = self._latest_token_row()
         return {
-            "access_token": token_data[6],
-            "expiry_time": token_data[1] + timedelta(seconds=token_data[2]),
+            "access_token": token_row["access_token"],
+            "expiry_time": token_row["time"] + timedelta(seconds=token_row["expires_in"]),
         }
 
     def _construct_init_auth_url(self) -> str:
@@ -170,14 +263,13 @@ class SchwabAPI:
         return auth_url
 
     def _construct_headers_and_payload(self, returned_url: str) -> tuple:
-        code_start = returned_url.index("code=") + 5
-        code_end = returned_url.index("%40")
-        response_code = f"{returned_url[code_start:code_end]}@"
-        credentials = f"{self.__class__.APP_KEY_SCHWAB}:" f"{self.__class__.CLIENT_SECRET_SCHWAB}"
-        base64_credentials = base64.b64encode(credentials.encode("utf-8")).decode("utf-8")
+        match = _AUTH_CODE_RE.search(returned_url)
+        if match is None:
+            raise ValueError("No authorization code found in the returned URL")
+        response_code = unquote(match.group(1))
 
         headers = {
-            "Authorization": f"Basic {base64_credentials}",
+            "Authorization": self._basic_auth_header(),
             "Content-Type": "application/x-www-form-urlencoded",
         }
         payload = {
@@ -194,7 +286,7 @@ class SchwabAPI:
             data=payload,
             timeout=30,
         )
-        return response.json()
+        return parse_json(response)
 
     def _authenticate(self):
         auth_url = self._construct_init_auth_url()
@@ -216,18 +308,15 @@ class SchwabAPI:
             "id_token": tokens["id_token"],
         }
         self.inserter.insert_data(table=self.schwab_access, data=access_refresh_token_data)
+        TOKEN_ROW_CACHE.invalidate()
+        _SHARED_TOKEN.clear()
         return tokens
 
     def _refresh_tokens(self):
-        refresh_token = self.retriever.retrieve_data(
-            table_name="schwab_access.schwab_access_refresh_token",
-            column="refresh_token",
-        )[-1][0]
+        refresh_token = self._latest_token_row()["refresh_token"]
         payload = {"grant_type": "refresh_token", "refresh_token": refresh_token}
-        credentials = f"{self.__class__.APP_KEY_SCHWAB}:" f"{self.__class__.CLIENT_SECRET_SCHWAB}"
-        encoded_creds = base64.b64encode(credentials.encode()).decode()
         headers = {
-            "Authorization": f"Basic {encoded_creds}",
+            "Authorization": self._basic_auth_header(),
             "Content-Type": "application/x-www-form-urlencoded",
         }
         response = self.session.post(
@@ -238,7 +327,7 @@ class SchwabAPI:
         )
 
         if response.status_code == 200:
-            tokens = response.json()
+            tokens = parse_json(response)
             current_datetime = datetime.now()
             access_refresh_token_data = {
                 "access_refresh_token_uuid": uuid.uuid4(),
@@ -251,6 +340,8 @@ class SchwabAPI:
                 "id_token": tokens["id_token"],
             }
             self.inserter.insert_data(table=self.schwab_access, data=access_refresh_token_data)
+            TOKEN_ROW_CACHE.invalidate()
+            _SHARED_TOKEN.clear()
             return {
                 "access_token": tokens["access_token"],
                 "expiry_time": current_datetime + timedelta(seconds=tokens["expires_in"]),
@@ -258,6 +349,15 @@ class SchwabAPI:
         LOGGER.error("Error refreshing access token: %s", response.text)
         return None
 
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drop cached fundamentals and quotes of every instance
+        (e.g. when the market session changes)
+        """
+        FUNDAMENTALS_CACHE.invalidate()
+        QUOTES_CACHE.invalidate()
+
     def movers(self, symbol_id: str, sort: str) -> dict:
         """
         Retrieve market movers data for a given symbol and sort order from the Schwab API
@@ -270,9 +370,9 @@ class SchwabAPI:
             dict: Movers data as a dictionary, or error details if retrieval fails
         """
         api_url = f"{self.market_data_base_url}/movers/{symbol_id}?sort={sort}"
-        response = requests.get(api_url, headers=self.headers, timeout=30)
+        response = self.session.get(api_url, headers=self.headers, timeout=10)
         if response.status_code == 200:
-            return response.json()
+            return parse_json(response)
         return {
             "status_code": response.status_code,
             "message": "Failed to retrieve data",
@@ -324,16 +424,102 @@ class SchwabAPI:
             Fundamental data as a dictionary or error details if retrieval fails
         """
         ticker = self.stock_ticker if self.stock_ticker else stock_ticker
+        fundamental = FUNDAMENTALS_CACHE.get(ticker)
+        if fundamental is not None:
+            return fundamental
+
         api_url = f"{self.market_data_base_url}/instruments?symbol={ticker}&projection=fundamental"
-        response = requests.get(api_url, headers=self.headers, timeout=30)
+        with _SCHWAB_REQUEST_SLOTS:
+            response = self.session.get(api_url, headers=self.headers, timeout=10)
+        if response.status_code == 200:
+            fundamental = parse_json(response)
+            FUNDAMENTALS_CACHE.set(ticker, fundamental)
+            return fundamental
+        return {
+            "status_code": response.status_code,
+            "message": "Failed to retrieve data",
+            "content": response.text,
+        }
+
+    def quote_many(self, tickers: List[str]) -> dict:
+        """
+        Retrieve real-time quote data for several stock tickers in one request
+
+        Quotes returned by the API are kept on the instance, so later lookups of the
+        same tickers (last_price, volume, ...) do not hit the API again. Quotes
+        fetched by any instance in the last few seconds are reused (QUOTES_CACHE).
+
+        Parameters
+            tickers (list): Stock ticker symbols to fetch quotes for
+
+        Returns:
+            Quote data keyed by ticker, or error details if retrieval fails
+        """
+        quotes = {}
+        missing = []
+        for ticker in tickers:
+            quote = QUOTES_CACHE.get(ticker)
+            if quote is None:
+                missing.append(ticker)
+            else:
+                quotes[ticker] = quote
+        if not missing:
+            self._quotes_cache.update(quotes)
+            return quotes
+
+        with _SCHWAB_REQUEST_SLOTS:
+            response = self.session.get(
+                f"{self.market_data_base_url}/quotes",
+                params={"symbols": ",".join(missing), "fields": "quote,reference"},
+                headers=self.headers,
+                timeout=10,
+            )
         if response.status_code == 200:
-            return response.json()
+            fetched = parse_json(response)
+            for ticker, quote in fetched.items():
+                QUOTES_CACHE.set(ticker, quote)
+            quotes.update(fetched)
+            self._quotes_cache.update(quotes)
+            return quotes
         return {
             "status_code": response.status_code,
             "message": "Failed to retrieve data",
             "content": response.text,
         }
 
+    def quote_batch(self, tickers: List[str], max_workers: int = 16) -> dict:
+        """
+        Retrieve quotes for a long ticker list with concurrent multi-symbol requests
+
+        The list is split into batches of SCHWAB_QUOTES_PER_REQUEST symbols that are
+        fetched in parallel; at most SCHWAB_MAX_CONCURRENT_REQUESTS run at once.
+        Batches that fail are logged and left out of the result.
+
+        Parameters
+            tickers (list): Stock ticker symbols to fetch quotes for
+            max_workers (int): Maximum number of threads issuing requests
+
+        Returns:
+            dict: Quote data keyed by ticker
+        """
+        batches = [
+            tickers[start : start + SCHWAB_QUOTES_PER_REQUEST]
+            for start in range(0, len(tickers), SCHWAB_QUOTES_PER_REQUEST)
+        ]
+        if len(batches) <= 1:
+            responses = [self.quote_many(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                responses = list(executor.map(self.quote_many, batches))
+
+        quotes = {}
+        for response in responses:
+            if "status_code" in response and "message" in response:
+                LOGGER.warning("Schwab quotes batch failed: %s", response["status_code"])
+                continue
+            quotes.update(response)
+        return quotes
+
     def quote_single(self, stock_ticker: Optional[str] = None):
         """
         Retrieve real-time quote data for a single stock ticker symbol
@@ -345,19 +531,26 @@ class SchwabAPI:
             Real-time quote data as a dictionary, or error details if retrieval fails
         """
         if stock_ticker is not None:
-            api_url = f"{self.market_data_base_url}/{stock_ticker}/quotes"
-            response = requests.get(api_url, headers=self.headers, timeout=30)
-            if response.status_code == 200:
-                return response.json()
-            return {
-                "status_code": response.status_code,
-                "message": "Failed to retrieve data",
-                "content": response.text,
-            }
+            return self.quote_many([stock_ticker])
         if self.stock_ticker is not None:
             return self._quote_single
         raise ValueError("stock_ticker needed in constructor or as parameter")
 
+    def _cached_quote(self, stock_ticker: str) -> dict:
+        """Quote data of one ticker, fetched only if it is not cached yet"""
+        quote = self._quotes_cache.get(stock_ticker)
+        if quote is None:
+            quote = self.quote_many([stock_ticker]).get(stock_ticker, {})
+        return quote
+
+    def _quote_field(self, stock_ticker: Optional[str], section: str, key: str) -> Any:
+        """Field of a ticker's quote data (constructor's ticker by default), None if missing"""
+        if stock_ticker is not None:
+            quote = self._cached_quote(stock_ticker)
+        else:
+            quote = self._quote_single.get(self.stock_ticker) or {}
+        return (quote.get(section) or {}).get(key)
+
     def last_price(self, stock_ticker: Optional[str] = None) -> Optional[float]:
         """
         Retrieve the last traded price for a given stock ticker symbol
@@ -368,17 +561,7 @@ class SchwabAPI:
         Returns:
             float | None: Last traded price as a float, or None if not available
         """
-        if stock_ticker is not None:
-            request = self.quote_single(stock_ticker=stock_ticker)
-            try:
-                return request[stock_ticker]["quote"]["lastPrice"]
-            except KeyError:
-                return None
-        else:
-            try:
-                return self._quote_single[self.stock_ticker]["quote"]["lastPrice"]
-            except KeyError:
-                return None
+        return self._quote_field(stock_ticker, "quote", "lastPrice")
 
     def change_percentage(self, stock_ticker: Optional[str] = None) -> Optional[float]:
         """
@@ -389,17 +572,7 @@ class SchwabAPI:
         Returns:
             float | None: Percentage change in price as a float, or None if not available
         """
-        if stock_ticker is not None:
-            request = self.quote_single(stock_ticker=stock_ticker)
-            try:
-                return request[stock_ticker]["quote"]["netPercentChange"]
-            except KeyError:
-                return None
-        else:
-            try:
-                return self._quote_single[self.stock_ticker]["quote"]["netPercentChange"]
-            except KeyError:
-                return None
+        return self._quote_field(stock_ticker, "quote", "netPercentChange")
 
     def volume(self, stock_ticker: Optional[str] = None) -> Optional[float]:
         """
@@ -412,8 +585,7 @@ class SchwabAPI:
             float | None: Total trading volume as a float, or None if not available
         """
         if stock_ticker is not None:
-            request = self.quote_single(stock_ticker=stock_ticker)
-            return request[stock_ticker]["quote"]["totalVolume"]
+            return self._cached_quote(stock_ticker)["quote"]["totalVolume"]
         return self._quote_single[self.stock_ticker]["quote"]["totalVolume"]
 
     def quote_time(self, stock_ticker: Optional[str] = None) -> datetime | str:
@@ -424,11 +596,11 @@ class SchwabAPI:
             stock_ticker (str): Stock ticker symbol to fetch quote time for (optional)
 
         Returns:
-            datetime: Datetime object representing the quote time
+            datetime: Timezone-aware (UTC) datetime of the quote
         """
         helper = Helpers()
         if stock_ticker:
-            quote_data = self.quote_single(stock_ticker=stock_ticker)
+            quote_data = self._cached_quote(stock_ticker)
         else:
             quote_data = self._quote_single[self.stock_ticker]
 
@@ -437,7 +609,10 @@ class SchwabAPI:
         except KeyError as e:
             raise KeyError(f"Missing key in quote data: {e}") from e
 
-        return helper.detect_and_convert_timestamp(timestamp=quote_time)
+        # quote_time columns are TIMESTAMP WITH TIME ZONE, so the UTC result is made aware
+        return helper.detect_and_convert_timestamp(timestamp=quote_time).replace(
+            tzinfo=timezone.utc
+        )
 
     def company_name(self, stock_ticker: Optional[str] = None) -> Optional[str]:
         """
@@ -449,17 +624,7 @@ class SchwabAPI:
         Returns:
             str | None: The company name associated with the stock ticker, or None if not found
         """
-        if stock_ticker is not None:
-            request = self.quote_single(stock_ticker=stock_ticker)
-            try:
-                return request[stock_ticker]["reference"]["description"]
-            except KeyError:
-                return None
-        else:
-            try:
-                return self._quote_single[self.stock_ticker]["reference"]["description"]
-            except KeyError:
-                return None
+        return self._quote_field(stock_ticker, "reference", "description")
 
 
 # ============================================================================
@@ -483,20 +648,36 @@ class SearchYahooFinance:
         self.yahoo_finance_api = None
         self.yahoo_finance_api_info = None
 
+    # .info keys that the lighter fast_info can answer, with their fast_info names
+    FAST_INFO_KEYS = {
+        "marketCap": "market_cap",
+        "averageVolume10days": "ten_day_average_volume",
+        "averageVolume": "three_month_average_volume",
+    }
+
     def _initialize_api(self):
         """
-        Initialize the Yahoo Finance API client and
-        fetch ticker information if not already initialized
+        Initialize the Yahoo Finance API client if not already initialized
+        (ticker information is fetched separately, on first use)
         """
         if not self.yahoo_finance_api and self.ticker:
             self.yahoo_finance_api = yf.Ticker(self.ticker)
-            self.yahoo_finance_api_info = self.yahoo_finance_api.info
 
     def _get_info(self, key):
         """
         Retrieve a value from Yahoo Finance API info by key after ensuring API initialization
+
+        Keys covered by fast_info are read from it unless the full info is already
+        loaded; the full info (several requests) is only fetched for other keys.
         """
         self._initialize_api()
+        if self.yahoo_finance_api_info is None and key in self.FAST_INFO_KEYS:
+            try:
+                return self.yahoo_finance_api.fast_info[self.FAST_INFO_KEYS[key]]
+            except (KeyError, TypeError, ValueError):
+                pass  # Not available from fast_info, use the full info below
+        if self.yahoo_finance_api_info is None:
+            self.yahoo_finance_api_info = self.yahoo_finance_api.info
         return self.yahoo_finance_api_info.get(key, None)
 
     def company_country(self):
@@ -636,6 +817,11 @@ class AlphaVantageAPI:
 
     ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY")
 
+    __slots__ = ("api_key", "base_url", "session", "auth")
+
+    # Client-side pacing to the provider's quota (free tier: 5 requests per minute)
+    RATE_LIMITER = TokenBucket(requests_per_minute=5)
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Alpha Vantage API client
@@ -652,10 +838,11 @@ class AlphaVantageAPI:
             raise ValueError(msg)
 
         self.base_url = "https://www.alphavantage.co/query"
-        self.session = requests.Session()
+        self.session = PROVIDER_SESSION
         # HTML Basic Auth with API key as username
-        self.session.auth = (self.api_key, "")
+        self.auth = (self.api_key, "")
 
+    @cached_response(policy="long")
     def _make_request(self, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Make authenticated request to Alpha Vantage API
@@ -669,10 +856,11 @@ class AlphaVantageAPI:
         Raises:
             requests.exceptions.RequestException: If request fails
         """
+        self.RATE_LIMITER.acquire()
         try:
-            response = self.session.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, auth=self.auth, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
 
         except requests.exceptions.HTTPError as e:
             if response.status_code == 401:
@@ -710,11 +898,8 @@ class AlphaVantageAPI:
         try:
             data = self._make_request(params=params)
 
-            # Extract top gainers list
-            top_gainers_list = data.get("top_gainers", [])
-
-            # Return list of tickers only
-            return [stock["ticker"] for stock in top_gainers_list if "ticker" in stock]
+            # Return the tickers of the top gainers (every entry carries "ticker")
+            return [stock["ticker"] for stock in data.get("top_gainers", ())]
 
         except requests.exceptions.Timeout:
             print("API request timed out")
@@ -742,6 +927,8 @@ class PolygonAPI:
 
     POLYGON_API_KEY = os.getenv("POLYGON_API_KEY")
 
+    __slots__ = ("api_key", "client")
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Polygon API client
@@ -766,17 +953,17 @@ class PolygonAPI:
             list[str]: List of ticker symbols for top gainers.
                        Returns empty list if API call fails.
         """
+        cached = POLYGON_GAINERS_CACHE.get("gainers")
+        if cached is not None:
+            return list(cached)
+
         try:
             tickers = self.client.get_snapshot_direction("stocks", direction="gainers")
 
-            result = []
-            for item in tickers:
-                # Verify this is a TickerSnapshot and a float
-                if isinstance(item, TickerSnapshot) and isinstance(
-                    item.todays_change_percent, float
-                ):
-                    result.append(item.ticker)
+            # The SDK returns TickerSnapshot items; skip those without a change percent
+            result = [item.ticker for item in tickers if item.todays_change_percent is not None]
 
+            POLYGON_GAINERS_CACHE.set("gainers", tuple(result))
             return result
 
         except requests.exceptions.RequestException as e:
@@ -805,6 +992,11 @@ class FMPApi:
 
     FMP_API_KEY = os.getenv("FMP_API_KEY")
 
+    __slots__ = ("api_key", "base_url", "session", "auth")
+
+    # Client-side pacing to the provider's quota (starter plan: 300 requests per minute)
+    RATE_LIMITER = TokenBucket(requests_per_minute=300)
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize FMP API client
@@ -820,10 +1012,11 @@ class FMPApi:
             )
             raise ValueError(msg)
         self.base_url = "https://financialmodelingprep.com/stable"
-        self.session = requests.Session()
+        self.session = PROVIDER_SESSION
         # HTTP Basic Auth with API key as username
-        self.session.auth = (self.api_key, "")
+        self.auth = (self.api_key, "")
 
+    @cached_response(policy="short")
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Make authenticated request to FMP API
@@ -840,10 +1033,11 @@ class FMPApi:
         """
         url = f"{self.base_url}{endpoint}"
 
+        self.RATE_LIMITER.acquire()
         try:
-            response = self.session.get(url=url, params=params, timeout=30)
+            response = self.session.get(url=url, params=params, auth=self.auth, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
 
         except requests.exceptions.HTTPError as e:
             if response.status_code == 401:
@@ -871,10 +1065,11 @@ class FMPApi:
             list[str]: List of ticker symbols for top gainers.
                     Returns empty list if API call fails.
         """
-        endpoint = f"/biggest-gainers?apikey={self.__class__.FMP_API_KEY}"
+        endpoint = "/biggest-gainers"
+        params = {"apikey": self.api_key}
 
         try:
-            data = self._make_request(endpoint=endpoint)
+            data = self._make_request(endpoint=endpoint, params=params)
 
             # Return list of tickers only
             return [stock["symbol"] for stock in data if "symbol" in stock]
@@ -910,6 +1105,11 @@ class AlpacaAPI:
     ALPACA_CLIENT_ID = os.getenv("ALPACA_CLIENT_ID")
     ALPACA_CLIENT_SECRET = os.getenv("ALPACA_CLIENT_SECRET")
 
+    __slots__ = ("alpaca_client_id", "alpaca_client_secret", "base_url", "session", "headers")
+
+    # Client-side pacing to the provider's quota (basic plan: 200 requests per minute)
+    RATE_LIMITER = TokenBucket(requests_per_minute=200)
+
     def __init__(
         self,
         alpaca_client_id: Optional[str] = None,
@@ -918,11 +1118,12 @@ class AlpacaAPI:
         """
         Initialize Alpaca API client
         Args:
-            api_key: Your Alpaca API key (optional, defaults to env variable)
+            alpaca_client_id: Your Alpaca API key ID (optional, defaults to env variable)
+            alpaca_client_secret: Your Alpaca API secret key (optional, defaults to env variable)
         """
         self.alpaca_client_id = alpaca_client_id or self.__class__.ALPACA_CLIENT_ID
 
-        if not alpaca_client_id:
+        if not self.alpaca_client_id:
             msg = (
                 "Alpaca Client ID required. Set ALPACA_CLIENT_ID "
                 "environment variable or pass alpaca_client_id parameter"
@@ -931,7 +1132,7 @@ class AlpacaAPI:
 
         self.alpaca_client_secret = alpaca_client_secret or self.__class__.ALPACA_CLIENT_SECRET
 
-        if not alpaca_client_secret:
+        if not self.alpaca_client_secret:
             msg = (
                 "Alpaca Client Secret required. Set ALPACA_CLIENT_SECRET "
                 "environment variable or pass alpaca_client_secret parameter"
@@ -939,8 +1140,15 @@ class AlpacaAPI:
             raise ValueError(msg)
 
         self.base_url = "https://data.alpaca.markets/v1beta1"
-        self.session = requests.Session()
+        self.session = PROVIDER_SESSION
+        # Built once; the shared session is not given Alpaca's keys as default headers
+        self.headers = {
+            "accept": "application/json",
+            "APCA-API-KEY-ID": self.alpaca_client_id,
+            "APCA-API-SECRET-KEY": self.alpaca_client_secret,
+        }
 
+    @cached_response(policy="short")
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Make authenticated request to Alpaca API
@@ -957,16 +1165,11 @@ class AlpacaAPI:
         """
         url = f"{self.base_url}{endpoint}"
 
-        headers = {
-            "accept": "application/json",
-            "APCA-API-KEY-ID": self.alpaca_client_id,
-            "APCA-API-SECRET-KEY": self.alpaca_client_secret,
-        }
-
+        self.RATE_LIMITER.acquire()
         try:
-            response = self.session.get(url, headers=headers, params=params, timeout=30)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
 
         except requests.exceptions.HTTPError as e:
             if response.status_code == 401:
@@ -1047,10 +1250,11 @@ class AlpacaAPI:
             >>> print(active_stocks)
             ['AAPL', 'TSLA', 'NVDA', ...]
         """
-        endpoint = f"/screener/stocks/most-actives?by={by}?top={top}"
+        endpoint = "/screener/stocks/most-actives"
+        params = {"by": by, "top": top}
 
         try:
-            data = self._make_request(endpoint=endpoint)
+            data = self._make_request(endpoint=endpoint, params=params)
             raw_result = data.get("most_actives", [])
 
             # Return list of tickers only
@@ -1084,6 +1288,11 @@ class IntrinioAPI:
 
     INTRINIO_API_KEY = os.getenv("INTRINIO_API_KEY")
 
+    __slots__ = ("api_key", "base_url", "session", "auth")
+
+    # Client-side pacing to the provider's quota (10 requests per second)
+    RATE_LIMITER = TokenBucket(requests_per_minute=600)
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Intrinio API client
@@ -1102,10 +1311,11 @@ class IntrinioAPI:
             raise ValueError(msg)
 
         self.base_url = "https://api-v2.intrinio.com"
-        self.session = requests.Session()
+        self.session = PROVIDER_SESSION
         # HTTP Basic Auth with API key as username
-        self.session.auth = (self.api_key, "")
+        self.auth = (self.api_key, "")
 
+    @cached_response(policy="short")
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Make authenticated request to Intrinio API
@@ -1122,10 +1332,11 @@ class IntrinioAPI:
         """
         url = f"{self.base_url}{endpoint}"
 
+        self.RATE_LIMITER.acquire()
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, auth=self.auth, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
 
         except requests.exceptions.HTTPError as e:
             if response.status_code == 401:
@@ -1142,6 +1353,15 @@ class IntrinioAPI:
             LOGGER.error("Request failed: %s", e)
             raise
 
+    @staticmethod
+    def _security_tickers(securities: List[Dict[str, Any]]) -> List[str]:
+        """Extract the ticker symbols of a gainers/losers securities list"""
+        return [
+            ticker
+            for ticker in ((entry.get("security") or {}).get("ticker") for entry in securities)
+            if ticker
+        ]
+
     def get_stock_exchange_gainers(
         self,
         identifier: str = "USCOMP",
@@ -1188,15 +1408,7 @@ class IntrinioAPI:
 
         try:
             data = self._make_request(endpoint, params)
-            securities = data.get("securities", [])
-
-            # Extract just the ticker symbols
-            tickers = []
-            for security in securities:
-                security_info = security.get("security", {})
-                ticker = security_info.get("ticker")
-                if ticker:
-                    tickers.append(ticker)
+            tickers = self._security_tickers(data.get("securities", []))
 
             LOGGER.info("Retrieved %d gainers from %s", len(tickers), identifier)
             return tickers
@@ -1239,15 +1451,7 @@ class IntrinioAPI:
 
         try:
             data = self._make_request(endpoint, params)
-            securities = data.get("securities", [])
-
-            # Extract just the ticker symbols
-            tickers = []
-            for security in securities:
-                security_info = security.get("security", {})
-                ticker = security_info.get("ticker")
-                if ticker:
-                    tickers.append(ticker)
+            tickers = self._security_tickers(data.get("securities", []))
 
             LOGGER.info("Retrieved %d losers from %s", len(tickers), identifier)
             return tickers
@@ -17,9 +17,9 @@ Note:
     import dependencies between scanner modules.
 """
 
+import functools
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
 
 
 class MarketType(Enum):
@@ -30,20 +30,24 @@ class MarketType(Enum):
     AFTER_MARKET = "after_market"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScannerConfig:
-    """Configuration for each scanner type"""
+    """Configuration for each scanner type (immutable: shared read-only by the executor)"""
 
     market_type: MarketType
     scanner_class: type
-    active_scanners: List[str]
+    active_scanners: tuple[str, ...]
 
 
+@functools.lru_cache(maxsize=1)
 def get_scanner_configs():
     """
     Factory function to create configurations.
     Lazy import to avoid circular imports.
 
+    The result is built once and cached: treat it as read-only (copy() it before
+    modifying). ScannerConfig itself is frozen.
+
     NOTE: AfterMarket scanner is currently under development and disabled.
     The MarketType.AFTER_MARKET enum remains for database schema compatibility.
     """
@@ -58,19 +62,19 @@ def get_scanner_configs():
         MarketType.PRE_MARKET: ScannerConfig(
             market_type=MarketType.PRE_MARKET,
             scanner_class=PreMarket,
-            active_scanners=[
+            active_scanners=(
                 "charles_schwab_pre_market_movers",
                 "stock_analysis",
-            ],
+            ),
         ),
         MarketType.REGULAR_MARKET: ScannerConfig(
             market_type=MarketType.REGULAR_MARKET,
             scanner_class=RegularMarket,
-            active_scanners=[
+            active_scanners=(
                 "charles_schwab_regular_market_movers",
                 "stock_analysis_regular_market_gainers",
                 "stock_analysis_regular_market_active",
-            ],
+            ),
         ),
         # ⚠️ AFTER_MARKET: UNDER DEVELOPMENT - Configuration disabled
         # The implementation is incomplete and will be enabled in a future release
@@ -78,10 +82,10 @@ def get_scanner_configs():
         # MarketType.AFTER_MARKET: ScannerConfig(
         #     market_type=MarketType.AFTER_MARKET,
         #     scanner_class=AfterMarket,
-        #     active_scanners=[
+        #     active_scanners=(
         #         'charles_schwab_after_market_movers',
         #         'stock_analysis_after_market_gainers',
         #         'stock_analysis_after_market_active',
-        #     ]
+        #     )
         # )
     }
@@ -18,12 +18,17 @@ Global State:
     stop_events: Dict of threading.Event objects for stopping scanners
 """
 
+import logging
 import threading
 import time
 from datetime import datetime
+from typing import Callable
 
+from .apis import SchwabAPI
 from .config import MarketType, get_scanner_configs
 
+LOGGER = logging.getLogger(__name__)
+
 # Global dictionaries to track active scanners
 active_scanners = {}
 stop_events = {}
@@ -50,28 +55,61 @@ def execute_market_scanner(
     config = scanner_configs[market_type]
     scanner = config.scanner_class()
 
+    # A new market session starts: drop data cached during the previous one
+    SchwabAPI.clear_cache()
     log_message(f"Starting {market_type.value} scanner")
 
+    # Resolve the scanner methods once; missing ones are reported here and skipped
+    scanner_methods = []
+    for scanner_method_name in config.active_scanners:
+        scanner_method = getattr(scanner, scanner_method_name, None)
+        if scanner_method is None:
+            log_message(f"Method '{scanner_method_name}' not found", level="ERROR")
+        else:
+            scanner_methods.append((scanner_method_name, scanner_method))
+
+    # The scanner methods wait on different sources, so each cycle runs them side by
+    # side and lasts as long as the slowest one. Daemon threads (like the scanner
+    # thread itself) never keep the process alive once the scanners are stopped.
     while not stop_event.is_set():
-        for scanner_method_name in config.active_scanners:
-            if stop_event.is_set():
-                break
-
-            try:
-                scanner_method = getattr(scanner, scanner_method_name)
-                scanner_method()
-            except AttributeError:
-                log_message(f"Method '{scanner_method_name}' not found", level="ERROR")
-            except (RuntimeError, ValueError, KeyError, TypeError) as e:
-                log_message(f"Error in {scanner_method_name}: {str(e)}", level="ERROR")
-
-        if not stop_event.is_set():
-            log_message(f"Waiting {sleep_time} seconds till next update")
-            time.sleep(sleep_time)
+        method_threads = [
+            threading.Thread(
+                target=_run_scanner_method,
+                args=(name, method, stop_event),
+                daemon=True,
+                name=f"Scanner-{market_type.value}-{name}",
+            )
+            for name, method in scanner_methods
+        ]
+        for method_thread in method_threads:
+            method_thread.start()
+        for method_thread in method_threads:
+            method_thread.join()
+
+        if stop_event.is_set():
+            break
+        log_message(f"Waiting {sleep_time} seconds till next update")
+        if stop_event.wait(sleep_time):  # True as soon as the scanner is stopped
+            break
 
     log_message(f"{market_type.value} scanner stopped", level="WARN")
 
 
+def _run_scanner_method(
+    scanner_method_name: str, scanner_method: Callable[[], None], stop_event: threading.Event
+) -> None:
+    """Run one scanner method of a cycle, logging its errors so the next cycle still runs"""
+    if stop_event.is_set():
+        return
+    try:
+        scanner_method()
+    except (AttributeError, RuntimeError, ValueError, KeyError, TypeError) as e:
+        log_message(f"Error in {scanner_method_name}: {str(e)}", level="ERROR")
+    except Exception:  # pylint: disable=broad-exception-caught
+        # Anything else (LookupError, database or network errors) with its traceback
+        LOGGER.exception("Unexpected error in %s", scanner_method_name)
+
+
 def start_scanner_thread(market_type: MarketType, sleep_time: int = 10) -> dict:
     """
     Starts a scanner in a separate thread.
@@ -137,9 +175,16 @@ def stop_all_scanners():
     """Stops all active scanners"""
     log_message("Stopping all scanners...", level="WARN")
 
-    for market_name in list(active_scanners.keys()):
-        market_type = MarketType(market_name)
-        stop_scanner(market_type)
+    # Signal every scanner first, then wait for them together (at most 5 seconds in
+    # total rather than 5 seconds per scanner)
+    for stop_event in stop_events.values():
+        stop_event.set()
+    deadline = time.monotonic() + 5
+    for thread in active_scanners.values():
+        thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    active_scanners.clear()
+    stop_events.clear()
 
     log_message("All scanners stopped")
 
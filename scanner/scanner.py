@@ -12,20 +12,56 @@ This module contains:
 - AfterMarket: After market scanner implementation (UNDER DEVELOPMENT - Commented out)
 """
 
+import hashlib
+import json
 import logging
+import threading
 import uuid
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
-from db.scanners_db import InsertData, RetrieveData, UpdateData
+from db.scanners_db import (
+    INSERT_DATA,
+    RETRIEVE,
+    UPDATE_DATA,
+    InsertData,
+    RetrieveData,
+    UpdateData,
+)
+from helpers.cache import TTLCache
 from helpers.helpers import DBHelpers, Helpers
+from helpers.http import TRANSPORT_ERRORS
 
 from .apis import SchwabAPI, SearchYahooFinance
 from .scrapers import ScanStockAnalysis
-from .utilities import NewsItem, StockQuoteData
+from .utilities import NewsItem, StockQuoteData, YahooFundamentals
 
 LOGGER = logging.getLogger(__name__)
 
+# Yahoo company profile and short-interest data change at most daily; a ticker that goes
+# through the new/stale path again within a session reuses what was fetched
+YAHOO_DATA_CACHE = TTLCache(ttl=12 * 3600)
+
+# Tickers of one scan list processed at the same time (each waits mostly on HTTP and
+# database round-trips)
+DEFAULT_SCAN_WORKERS = 8
+
+# Runs a ticker's Yahoo requests while its own thread waits on Schwab (tasks submitted
+# here never submit further work, so scan workers can safely block on them)
+_SOURCE_POOL = ThreadPoolExecutor(max_workers=2 * DEFAULT_SCAN_WORKERS, thread_name_prefix="Yahoo")
+
+# One lock per ticker: scanner methods run concurrently, and two sources reporting
+# the same new ticker must not both insert it
+_TICKER_LOCKS: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+_TICKER_LOCKS_GUARD = threading.Lock()
+
+
+def _ticker_lock(stock_ticker: str) -> threading.Lock:
+    with _TICKER_LOCKS_GUARD:
+        return _TICKER_LOCKS[stock_ticker]
+
 
 # ============================================================================
 # DATA FETCHING AND PROCESSING
@@ -39,12 +75,41 @@ class StockDataFetcher:
         """Initialize StockDataFetcher with helper utilities."""
         self.helper = helper
 
-    def fetch_schwab_quote_data(self, stock_ticker: str) -> StockQuoteData:
+    def prefetch_schwab_quotes(
+        self, tickers: List[str], api: Optional[SchwabAPI] = None
+    ) -> Dict[str, dict]:
+        """
+        Fetch Schwab quotes for a whole scan list in as few requests as possible.
+
+        The mapping belongs to the caller's batch, which hands each quote to the scan
+        of its ticker. This is best effort: if it fails, the mapping is empty and each
+        ticker's quote is fetched on its own instead.
+
+        Parameters:
+        - tickers: Ticker symbols about to be scanned.
+        - api: Authenticated SchwabAPI instance to reuse (optional).
+
+        Returns: Quote data keyed by ticker, for the requested tickers only.
+        """
+        if not tickers:
+            return {}
+        wanted = set(tickers)
+        try:
+            quotes = (api or SchwabAPI()).quote_batch(tickers)
+        except (LookupError, RuntimeError, ValueError, TypeError, *TRANSPORT_ERRORS) as e:
+            LOGGER.warning("Could not prefetch Schwab quotes: %s", e)
+            return {}
+        return {ticker: quote for ticker, quote in quotes.items() if ticker in wanted}
+
+    def fetch_schwab_quote_data(
+        self, stock_ticker: str, schwab_quote: Optional[dict] = None
+    ) -> StockQuoteData:
         """
         Fetch basic quote data from Schwab API.
 
         Parameters:
         - stock_ticker: The ticker symbol of the stock.
+        - schwab_quote: Quote already fetched by prefetch_schwab_quotes (optional).
         Returns: StockQuoteData object with basic quote information.
 
         Example:
@@ -52,21 +117,29 @@ class StockDataFetcher:
             quote_data = fetch_schwab_quote_data("AAPL")
         """
         try:
-            api = SchwabAPI(stock_ticker=stock_ticker)
+            api = SchwabAPI(
+                stock_ticker=stock_ticker,
+                quote_data=schwab_quote,
+            )
             return StockQuoteData(
                 last_price=api.last_price(),
                 change_percentage=api.change_percentage(),
                 volume=api.volume(),
                 quote_time=api.quote_time(),
             )
-        except (KeyError, RuntimeError, ValueError, TypeError) as e:
+        except (KeyError, RuntimeError, ValueError, TypeError, *TRANSPORT_ERRORS) as e:
             LOGGER.warning("Error fetching Schwab quote data for %s: %s", stock_ticker, e)
             return StockQuoteData(quote_time=datetime.now())
 
-    def fetch_schwab_full_data(self, stock_ticker: str) -> StockQuoteData:
+    def fetch_schwab_full_data(
+        self, stock_ticker: str, schwab_quote: Optional[dict] = None
+    ) -> StockQuoteData:
         """Fetch complete data including fundamentals from Schwab API"""
         try:
-            api = SchwabAPI(stock_ticker=stock_ticker)
+            api = SchwabAPI(
+                stock_ticker=stock_ticker,
+                quote_data=schwab_quote,
+            )
             return StockQuoteData(
                 company_name=api.company_name(),
                 last_price=api.last_price(),
@@ -78,48 +151,60 @@ class StockDataFetcher:
                 avg_vol_3_month=api.average_volume(output=30),
                 market_cap=api.market_cap(),
             )
-        except (KeyError, RuntimeError, ValueError, TypeError) as e:
+        except (KeyError, RuntimeError, ValueError, TypeError, *TRANSPORT_ERRORS) as e:
             LOGGER.warning("Error fetching full Schwab data for %s: %s", stock_ticker, e)
             return StockQuoteData(quote_time=datetime.now())
 
-    def fetch_yahoo_data(self, stock_ticker: str) -> Dict[str, Any]:
-        """Fetch additional data from Yahoo Finance"""
-        scan = SearchYahooFinance(ticker=stock_ticker)
+    def fetch_yahoo_data(
+        self, stock_ticker: str, scan: Optional[SearchYahooFinance] = None
+    ) -> YahooFundamentals:
+        """
+        Fetch additional data from Yahoo Finance
 
-        return {
-            "company_country": scan.company_country(),
-            "business_website": scan.website(),
-            "business_summary": scan.business_summary(),
-            "stock_float": scan.stock_float(),
-            "held_insiders": scan.held_insiders(),
-            "held_institutions": scan.held_institutions(),
-            "operating_cash_flow": scan.operating_cash_flow(),
-            "sector": scan.sector(),
-            "industry": scan.industry(),
-            "short_ratio": scan.short_ratio(),
-            "shares_short": scan.shares_short(),
-            "short_percent_float": scan.short_percent_float(),
-            "shares_percent_shares_outstanding": scan.shares_percent_shares_outstanding(),
-            "shares_short_prior_month": scan.shares_short_prior_month(),
-            "shares_short_previous_month_date": scan.shares_short_previous_month_date(),
-            "short_ratio_date": scan.short_ratio_date(),
-        }
+        Pass scan to reuse a SearchYahooFinance the caller will also read news from, so
+        the Yahoo ticker (session and loaded info) is set up only once per scan.
+        Results are cached per ticker in YAHOO_DATA_CACHE.
+        """
+        cached = YAHOO_DATA_CACHE.get(stock_ticker)
+        if cached is not None:
+            return cached
+
+        scan = scan or SearchYahooFinance(ticker=stock_ticker)
+        yahoo_data = YahooFundamentals(
+            company_country=scan.company_country(),
+            business_website=scan.website(),
+            business_summary=scan.business_summary(),
+            stock_float=scan.stock_float(),
+            held_insiders=scan.held_insiders(),
+            held_institutions=scan.held_institutions(),
+            operating_cash_flow=scan.operating_cash_flow(),
+            sector=scan.sector(),
+            industry=scan.industry(),
+            short_ratio=scan.short_ratio(),
+            shares_short=scan.shares_short(),
+            short_percent_float=scan.short_percent_float(),
+            shares_percent_shares_outstanding=scan.shares_percent_shares_outstanding(),
+            shares_short_prior_month=scan.shares_short_prior_month(),
+            shares_short_previous_month_date=scan.shares_short_previous_month_date(),
+            short_ratio_date=scan.short_ratio_date(),
+        )
+        YAHOO_DATA_CACHE.set(stock_ticker, yahoo_data)
+        return yahoo_data
 
     def parse_news_item(self, news: Dict) -> Optional[NewsItem]:
         """Parse a news item from Yahoo Finance API"""
         try:
             return NewsItem(
-                uuid_news=news["id"],
+                uuid_news=uuid.UUID(news["id"]),
                 title=news["content"]["title"].strip(),
                 publisher=news["content"]["provider"]["displayName"],
                 link=news["content"]["canonicalUrl"]["url"],
-                publish_time=datetime.fromisoformat(
-                    news["content"]["pubDate"].replace("Z", "+00:00")
-                ).strftime("%Y-%m-%d %H:%M:%S"),
+                # Kept as an aware datetime: the driver sends it to the TIMESTAMPTZ column as is
+                publish_time=datetime.fromisoformat(news["content"]["pubDate"]),
                 content_type=news["content"]["contentType"],
                 related_tickers=news.get("relatedTickers"),
             )
-        except KeyError as e:
+        except (KeyError, ValueError) as e:
             LOGGER.error("Error parsing news item: %s", e)
             return None
 
@@ -152,37 +237,46 @@ class NewsProcessor:
         - Processes and inserts news for a given stock ticker
             process_company_news("AAPL", "some-uuid", news_list)
         """
-        for news_dict in company_news:
-            news = self.fetcher.parse_news_item(news_dict)
-            if not news:
-                continue
+        if not company_news:
+            return
 
-            # Check if news already exists
-            existing_news_uuids = self.retriever.retrieve_data(
+        # News already stored for this stock (read once for the whole list)
+        existing_uuids = {
+            row[0]
+            for row in self.retriever.retrieve_data(
                 column="uuid_news",
                 table_name="equities.stock_news",
                 condition_column="stock_uuid",
                 condition_value=stock_uuid,
             )
+        }
 
-            if news.uuid_news in {str(row[0]) for row in existing_news_uuids}:
+        new_rows = []
+        for news_dict in company_news:
+            news = self.fetcher.parse_news_item(news_dict)
+            if not news or news.uuid_news in existing_uuids:
                 continue
 
-            # Insert new news
-            news_data = {
-                "stock_uuid": stock_uuid,
-                "ticker": stock_ticker,
-                "uuid_news": news.uuid_news,
-                "title": news.title,
-                "publisher": news.publisher,
-                "link": news.link,
-                "publish_time": news.publish_time,
-                "type": news.content_type,
-                "related_tickers": news.related_tickers,
-            }
+            new_rows.append(
+                {
+                    "stock_uuid": stock_uuid,
+                    "ticker": stock_ticker,
+                    "uuid_news": news.uuid_news,
+                    "title": news.title,
+                    "publisher": news.publisher,
+                    "link": news.link,
+                    "publish_time": news.publish_time,
+                    "type": news.content_type,
+                    "related_tickers": news.related_tickers,
+                }
+            )
+            existing_uuids.add(news.uuid_news)
 
-            self.inserter.insert_data(table="equities.stock_news", data=news_data)
-            print(f"Inserted news for '{stock_ticker}' -> {news.title[:50]}...")
+        # Insert all new news in one round-trip
+        if not self.inserter.insert_many(table="equities.stock_news", rows=new_rows):
+            return
+        for row in new_rows:
+            LOGGER.info("Inserted news for '%s' -> %.50s...", stock_ticker, row["title"])
 
 
 class TickerHistoryManager:
@@ -191,9 +285,26 @@ class TickerHistoryManager:
     def __init__(self, inserter: InsertData, retriever: RetrieveData):
         self.inserter = inserter
         self.retriever = retriever
+        # (stock_uuid, date) pairs known to be in ticker_history, so each stock is
+        # looked up at most once per day
+        self._recorded: set[tuple[str, date]] = set()
+
+    def add_today_if_needed(
+        self,
+        stock_uuid: str,
+        stock_ticker: str,
+        quote_time: datetime,
+        today: Optional[date] = None,
+    ):
+        """
+        Add today's date to ticker_history if not already present
+
+        Pass today to reuse a date computed once for a whole scan list.
+        """
+        today = today or datetime.now().date()
+        if (str(stock_uuid), today) in self._recorded:
+            return
 
-    def add_today_if_needed(self, stock_uuid: str, stock_ticker: str, quote_time: datetime):
-        """Add today's date to ticker_history if not already present"""
         existing_dates = self.retriever.retrieve_data(
             column="date",
             table_name="equities.ticker_history",
@@ -201,15 +312,21 @@ class TickerHistoryManager:
             condition_value=stock_uuid,
         )
 
-        if datetime.now().date() not in {row[0] for row in existing_dates}:
+        if today in {row[0] for row in existing_dates}:
+            self._recorded.add((str(stock_uuid), today))
+        else:
+            # Quote times are UTC-aware; history dates are kept in local time
+            local_quote_date = quote_time.astimezone().date()
             history_data = {
                 "ticker_history_uuid": uuid.uuid4(),
                 "stock_uuid": stock_uuid,
-                "date": quote_time.date(),
-                "week": quote_time.isocalendar()[1],
+                "date": local_quote_date,
+                "week": local_quote_date.isocalendar()[1],
             }
             self.inserter.insert_data(table="equities.ticker_history", data=history_data)
-            print(f"Added ticker history for '{stock_ticker}'")
+            LOGGER.info("Added ticker history for '%s'", stock_ticker)
+            if local_quote_date == today:
+                self._recorded.add((str(stock_uuid), today))
 
 
 # ============================================================================
@@ -232,6 +349,8 @@ class ScannerCore:
         self.updater = updater
         self.helper = helper
         self.db_helper = DBHelpers()
+        # Today's date, refreshed at the start of each scan (see refresh_today)
+        self.today = datetime.now().date()
 
         # Initialize sub-components
         self.fetcher = StockDataFetcher(helper)
@@ -247,6 +366,9 @@ class ScannerCore:
         market_type: str,
         source: str,
         position: int,
+        known_tickers: Optional[frozenset] = None,
+        known_scanner_tickers: Optional[frozenset] = None,
+        schwab_quote: Optional[dict] = None,
     ):
         """
         Scan a stock ticker and update or add its data in the database
@@ -258,30 +380,64 @@ class ScannerCore:
             market_type (str): Type of market (e.g., equities, options)
             source (str): Source from which the ticker was found
             position (int): Position or rank of the ticker in the scan
+            known_tickers (frozenset): Tickers already known to be in equities (optional)
+            known_scanner_tickers (frozenset): Tickers already known to be in the
+                market's scanner table (optional)
+            schwab_quote (dict): The ticker's Schwab quote, already fetched for its batch
+                (optional)
         """
-        print(f"---- << {market_type} >> '{stock_ticker}' from '{source}' ({position}) ----")
+        LOGGER.info("<< %s >> '%s' from '%s' (%s)", market_type, stock_ticker, source, position)
 
-        tickers_in_db = self.db_helper.get_tickers_in_db()
+        with _ticker_lock(stock_ticker):
+            if self._ticker_in_table(stock_ticker, known_tickers):
+                self._update_existing_ticker(
+                    stock_ticker=stock_ticker,
+                    scanner_table=scanner_table,
+                    market=market,
+                    known_scanner_tickers=known_scanner_tickers,
+                    schwab_quote=schwab_quote,
+                )
+            else:
+                self._add_new_ticker(
+                    stock_ticker=stock_ticker,
+                    scanner_table=scanner_table,
+                    schwab_quote=schwab_quote,
+                )
 
-        if stock_ticker in tickers_in_db:
-            self._update_existing_ticker(
-                stock_ticker=stock_ticker, scanner_table=scanner_table, market=market
-            )
-        else:
-            self._add_new_ticker(stock_ticker=stock_ticker, scanner_table=scanner_table)
+    def _ticker_in_table(
+        self, stock_ticker: str, known: Optional[frozenset], market: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether a ticker is stored in a market's table
 
-    def _update_existing_ticker(self, stock_ticker: str, scanner_table: str, market: str):
+        Tickers are never removed, so a hit in a batch snapshot (known) is final; a miss is
+        re-checked against the current list, which another scanner may have extended since.
+        """
+        if known is not None and stock_ticker in known:
+            return True
+        return stock_ticker in self.db_helper.get_tickers_in_db(market=market)
+
+    def _update_existing_ticker(
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        stock_ticker: str,
+        scanner_table: str,
+        market: str,
+        known_scanner_tickers: Optional[frozenset] = None,
+        schwab_quote: Optional[dict] = None,
+    ):
         """Handle existing ticker update logic"""
-        print(f"... Updating -> '{stock_ticker}'")
+        LOGGER.info("... Updating -> '%s'", stock_ticker)
 
-        quote_time_db = self.retriever.retrieve_data(
-            column="quote_time",
+        row = self.retriever.retrieve_row(
+            columns=("quote_time", "stock_uuid"),
             table_name="equities.stock_data",
             condition_column="ticker",
             condition_value=stock_ticker,
-        )[0][0]
-
-        stock_uuid = self.db_helper.get_uuid(ticker=stock_ticker, market="equities")
+        )
+        if row is None:
+            raise LookupError(f"No stock data found for ticker '{stock_ticker}'.")
+        quote_time_db, stock_uuid = row
 
         if self._is_same_date_as_today(quote_time_db):
             self._update_today_data(
@@ -289,30 +445,42 @@ class ScannerCore:
                 scanner_table=scanner_table,
                 market=market,
                 stock_uuid=stock_uuid,
+                known_scanner_tickers=known_scanner_tickers,
+                schwab_quote=schwab_quote,
             )
         else:
             self._update_stale_data(
                 stock_ticker=stock_ticker,
                 scanner_table=scanner_table,
                 stock_uuid=stock_uuid,
+                schwab_quote=schwab_quote,
             )
 
     def _update_today_data(
-        self, stock_ticker: str, scanner_table: str, market: str, stock_uuid: str
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        stock_ticker: str,
+        scanner_table: str,
+        market: str,
+        stock_uuid: str,
+        known_scanner_tickers: Optional[frozenset] = None,
+        schwab_quote: Optional[dict] = None,
     ):
         """Update data that's already current for today"""
-        tickers_in_scanner = self.db_helper.get_tickers_in_db(market=market)
-        quote_data = self.fetcher.fetch_schwab_quote_data(stock_ticker=stock_ticker)
+        quote_data = self.fetcher.fetch_schwab_quote_data(
+            stock_ticker=stock_ticker, schwab_quote=schwab_quote
+        )
 
-        if stock_ticker in tickers_in_scanner:
+        if self._ticker_in_table(stock_ticker, known_scanner_tickers, market=market):
             self._update_scanner_table(table=scanner_table, stock_uuid=stock_uuid, data=quote_data)
-            print(f"... Updated scanner table for '{stock_ticker}'")
+            LOGGER.info("... Updated scanner table for '%s'", stock_ticker)
         else:
             self._insert_scanner_table(table=scanner_table, ticker=stock_ticker, data=quote_data)
             self.history_manager.add_today_if_needed(
                 stock_uuid=stock_uuid,
                 stock_ticker=stock_ticker,
                 quote_time=quote_data.quote_time,
+                today=self.today,
             )
 
             scan = SearchYahooFinance(ticker=stock_ticker)
@@ -322,18 +490,41 @@ class ScannerCore:
                 company_news=scan.company_news(),
             )
 
-        print("---- " * 8)
+    def _fetch_full_data(
+        self, stock_ticker: str, schwab_quote: Optional[dict] = None
+    ) -> tuple[StockQuoteData, SearchYahooFinance, YahooFundamentals]:
+        """
+        Fetch a ticker's full Schwab data and its Yahoo data at the same time
+
+        Returns:
+            tuple: Schwab data, the SearchYahooFinance used (for news) and the Yahoo data
+        """
+        scan = SearchYahooFinance(ticker=stock_ticker)
+        yahoo_future = _SOURCE_POOL.submit(
+            self.fetcher.fetch_yahoo_data, stock_ticker=stock_ticker, scan=scan
+        )
+        schwab_data = self.fetcher.fetch_schwab_full_data(
+            stock_ticker=stock_ticker, schwab_quote=schwab_quote
+        )
+        return schwab_data, scan, yahoo_future.result()
 
-    def _update_stale_data(self, stock_ticker: str, scanner_table: str, stock_uuid: str):
+    def _update_stale_data(
+        self,
+        stock_ticker: str,
+        scanner_table: str,
+        stock_uuid: str,
+        schwab_quote: Optional[dict] = None,
+    ):
         """Update data that's outdated (not from today)"""
-        schwab_data = self.fetcher.fetch_schwab_full_data(stock_ticker=stock_ticker)
-        yahoo_data = self.fetcher.fetch_yahoo_data(stock_ticker=stock_ticker)
+        schwab_data, scan, yahoo_data = self._fetch_full_data(stock_ticker, schwab_quote)
 
         self._update_stock_data_table(stock_uuid, schwab_data, yahoo_data)
 
         self._update_short_data_table(stock_uuid, yahoo_data)
 
-        self.history_manager.add_today_if_needed(stock_uuid, stock_ticker, schwab_data.quote_time)
+        self.history_manager.add_today_if_needed(
+            stock_uuid, stock_ticker, schwab_data.quote_time, today=self.today
+        )
 
         quote_data = StockQuoteData(
             last_price=schwab_data.last_price,
@@ -344,21 +535,19 @@ class ScannerCore:
 
         self._insert_scanner_table(scanner_table, stock_ticker, quote_data)
 
-        scan = SearchYahooFinance(ticker=stock_ticker)
         self.news_processor.process_company_news(
             stock_ticker=stock_ticker,
             stock_uuid=stock_uuid,
             company_news=scan.company_news(),
         )
 
-        print("---- " * 8)
-
-    def _add_new_ticker(self, stock_ticker: str, scanner_table: str):
+    def _add_new_ticker(
+        self, stock_ticker: str, scanner_table: str, schwab_quote: Optional[dict] = None
+    ):
         """Add completely new ticker to database"""
-        print(f"- Adding new stock -> {stock_ticker}")
+        LOGGER.info("- Adding new stock -> %s", stock_ticker)
 
-        schwab_data = self.fetcher.fetch_schwab_full_data(stock_ticker=stock_ticker)
-        yahoo_data = self.fetcher.fetch_yahoo_data(stock_ticker=stock_ticker)
+        schwab_data, scan, yahoo_data = self._fetch_full_data(stock_ticker, schwab_quote)
         stock_uuid = uuid.uuid4()
 
         self._insert_stock_data_table(
@@ -374,6 +563,7 @@ class ScannerCore:
             stock_uuid=stock_uuid,
             stock_ticker=stock_ticker,
             quote_time=schwab_data.quote_time,
+            today=self.today,
         )
 
         quote_data = StockQuoteData(
@@ -385,15 +575,12 @@ class ScannerCore:
 
         self._insert_scanner_table(table=scanner_table, ticker=stock_ticker, data=quote_data)
 
-        scan = SearchYahooFinance(ticker=stock_ticker)
         self.news_processor.process_company_news(
             stock_ticker=stock_ticker,
             stock_uuid=str(stock_uuid),
             company_news=scan.company_news(),
         )
 
-        print("---- " * 8)
-
     # Database operation helpers
     def _update_scanner_table(self, table: str, stock_uuid: str, data: StockQuoteData):
         update_params = {
@@ -418,23 +605,26 @@ class ScannerCore:
             "volume": data.volume,
         }
         self.inserter.insert_data(table=table, data=insert_params)
+        self.db_helper.invalidate_tickers_cache(table)
 
-    def _update_stock_data_table(self, stock_uuid: str, schwab: StockQuoteData, yahoo: Dict):
+    def _update_stock_data_table(
+        self, stock_uuid: str, schwab: StockQuoteData, yahoo: YahooFundamentals
+    ):
         update_params = {
             "quote_time": schwab.quote_time,
-            "stock_float": yahoo["stock_float"],
+            "stock_float": yahoo.stock_float,
             "market_cap": schwab.market_cap,
-            "held_insiders": yahoo["held_insiders"],
-            "held_institutions": yahoo["held_institutions"],
+            "held_insiders": yahoo.held_insiders,
+            "held_institutions": yahoo.held_institutions,
             "avg_one_day_volume": schwab.avg_vol_1_day,
             "avg_vol_ten_days": schwab.avg_vol_10_day,
             "avg_vol_three_months": schwab.avg_vol_3_month,
-            "operating_cash_flow": yahoo["operating_cash_flow"],
-            "sector": yahoo["sector"],
-            "industry": yahoo["industry"],
-            "website": yahoo["business_website"],
-            "country": yahoo["company_country"],
-            "business_summary": yahoo["business_summary"],
+            "operating_cash_flow": yahoo.operating_cash_flow,
+            "sector": yahoo.sector,
+            "industry": yahoo.industry,
+            "website": yahoo.business_website,
+            "country": yahoo.company_country,
+            "business_summary": yahoo.business_summary,
         }
         self.updater.update_data(
             table="equities.stock_data",
@@ -443,16 +633,16 @@ class ScannerCore:
             where_constraint_data=stock_uuid,
         )
 
-    def _update_short_data_table(self, stock_uuid: str, yahoo: Dict):
+    def _update_short_data_table(self, stock_uuid: str, yahoo: YahooFundamentals):
         update_params = {
-            "shares_short": yahoo["shares_short"],
-            "short_ratio": yahoo["short_ratio"],
-            "short_percent_float": yahoo["short_percent_float"],
-            "shares_percent_shares_outstanding": yahoo["shares_percent_shares_outstanding"],
-            "shares_short_prior_month": yahoo["shares_short_prior_month"],
-            "short_ratio_date": self._convert_timestamp_if_needed(yahoo["short_ratio_date"]),
+            "shares_short": yahoo.shares_short,
+            "short_ratio": yahoo.short_ratio,
+            "short_percent_float": yahoo.short_percent_float,
+            "shares_percent_shares_outstanding": yahoo.shares_percent_shares_outstanding,
+            "shares_short_prior_month": yahoo.shares_short_prior_month,
+            "short_ratio_date": self._convert_timestamp_if_needed(yahoo.short_ratio_date),
             "shares_short_previous_month_date": self._convert_timestamp_if_needed(
-                yahoo["shares_short_previous_month_date"]
+                yahoo.shares_short_previous_month_date
             ),
         }
         self.updater.update_data(
@@ -463,41 +653,44 @@ class ScannerCore:
         )
 
     def _insert_stock_data_table(
-        self, stock_uuid: uuid.UUID, ticker: str, schwab: StockQuoteData, yahoo: Dict
+        self, stock_uuid: uuid.UUID, ticker: str, schwab: StockQuoteData, yahoo: YahooFundamentals
     ):
         insert_params = {
             "stock_uuid": stock_uuid,
             "quote_time": schwab.quote_time,
             "ticker": ticker,
             "company_name": schwab.company_name,
-            "stock_float": yahoo["stock_float"],
+            "stock_float": yahoo.stock_float,
             "market_cap": schwab.market_cap,
-            "held_insiders": yahoo["held_insiders"],
-            "held_institutions": yahoo["held_institutions"],
+            "held_insiders": yahoo.held_insiders,
+            "held_institutions": yahoo.held_institutions,
             "avg_one_day_volume": schwab.avg_vol_1_day,
             "avg_vol_ten_days": schwab.avg_vol_10_day,
             "avg_vol_three_months": schwab.avg_vol_3_month,
-            "operating_cash_flow": yahoo["operating_cash_flow"],
-            "sector": yahoo["sector"],
-            "industry": yahoo["industry"],
-            "website": yahoo["business_website"],
-            "country": yahoo["company_country"],
-            "business_summary": yahoo["business_summary"],
+            "operating_cash_flow": yahoo.operating_cash_flow,
+            "sector": yahoo.sector,
+            "industry": yahoo.industry,
+            "website": yahoo.business_website,
+            "country": yahoo.company_country,
+            "business_summary": yahoo.business_summary,
         }
         self.inserter.insert_data(table="equities.stock_data", data=insert_params)
+        self.db_helper.invalidate_tickers_cache("equities.stock_data")
 
-    def _insert_short_data_table(self, stock_uuid: uuid.UUID, ticker: str, yahoo: Dict):
+    def _insert_short_data_table(
+        self, stock_uuid: uuid.UUID, ticker: str, yahoo: YahooFundamentals
+    ):
         insert_params = {
             "stock_uuid": stock_uuid,
             "ticker": ticker,
-            "shares_short": yahoo["shares_short"],
-            "short_ratio": yahoo["short_ratio"],
-            "short_percent_float": yahoo["short_percent_float"],
-            "shares_percent_shares_outstanding": yahoo["shares_percent_shares_outstanding"],
-            "shares_short_prior_month": yahoo["shares_short_prior_month"],
-            "short_ratio_date": self._convert_timestamp_if_needed(yahoo["short_ratio_date"]),
+            "shares_short": yahoo.shares_short,
+            "short_ratio": yahoo.short_ratio,
+            "short_percent_float": yahoo.short_percent_float,
+            "shares_percent_shares_outstanding": yahoo.shares_percent_shares_outstanding,
+            "shares_short_prior_month": yahoo.shares_short_prior_month,
+            "short_ratio_date": self._convert_timestamp_if_needed(yahoo.short_ratio_date),
             "shares_short_previous_month_date": self._convert_timestamp_if_needed(
-                yahoo["shares_short_previous_month_date"]
+                yahoo.shares_short_previous_month_date
             ),
         }
         self.inserter.insert_data(table="equities.stock_short_data", data=insert_params)
@@ -508,7 +701,11 @@ class ScannerCore:
         return self.helper.detect_and_convert_timestamp(timestamp=timestamp)
 
     def _is_same_date_as_today(self, input_datetime: datetime) -> bool:
-        return input_datetime.date() == datetime.now().date()
+        return input_datetime.date() == self.today
+
+    def refresh_today(self) -> None:
+        """Set today's date, read by every ticker scanned until the next refresh"""
+        self.today = datetime.now().date()
 
 
 # ============================================================================
@@ -519,10 +716,11 @@ class ScannerCore:
 class Scanner:
     """Base scanner class using composition"""
 
-    def __init__(self):
-        self.inserter = InsertData()
-        self.retriever = RetrieveData()
-        self.updater = UpdateData()
+    def __init__(self, max_workers: int = DEFAULT_SCAN_WORKERS):
+        self.max_workers = max_workers
+        self.inserter = INSERT_DATA
+        self.retriever = RETRIEVE
+        self.updater = UPDATE_DATA
         self.helper = Helpers()
 
         # Delegate complex logic to ScannerCore
@@ -533,6 +731,28 @@ class Scanner:
             helper=self.helper,
         )
 
+        # Digest of the last screener payload scanned by each source (see _payload_digest)
+        self._payload_digests: Dict[str, str] = {}
+
+    @staticmethod
+    def _payload_digest(payload: Any) -> str:
+        """
+        Digest of a screener payload, compared with the previous cycle's to skip a rescan
+
+        A screener payload carries each ticker's price, change and volume, so an identical
+        payload means the scan would only rewrite the rows already stored. Callers record
+        the digest only once the scan succeeded, so a failed batch is retried next cycle.
+
+        Parameters:
+            payload (Any): JSON-serializable screener response
+
+        Returns:
+            str: Hex digest of the payload
+        """
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
     def scan_ticker(
         # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
@@ -554,6 +774,7 @@ class Scanner:
             source (str): Source of the scan request
             position (int): Position or rank of the ticker in the scan
         """
+        self.core.refresh_today()
         self.core.scan_ticker(
             stock_ticker=stock_ticker,
             scanner_table=scanner_table,
@@ -563,6 +784,68 @@ class Scanner:
             position=position,
         )
 
+    def scan_batch(
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        tickers: List[str],
+        scanner_table: str,
+        market: str,
+        market_type: str,
+        source: str,
+        start: int = 0,
+        ignore_errors: tuple = (),
+        quotes_api: Optional[SchwabAPI] = None,
+    ):
+        """
+        Scan a list of tickers concurrently, reading the stored ticker lists once and
+        fetching every ticker's Schwab quote with batched /quotes requests
+
+        Up to max_workers tickers are scanned at a time (database calls use the threaded
+        connection pool, and the per-ticker lock keeps duplicates apart). Other errors
+        are raised once every ticker has finished.
+
+        Parameters:
+            tickers (list): Ticker symbols to scan, in rank order
+            scanner_table (str): Database table for scanner results
+            market (str): Market where the tickers are listed
+            market_type (str): Type of market (e.g., equity, options)
+            source (str): Source of the scan request
+            start (int): Position of the first ticker
+            ignore_errors (tuple): Exception types that skip a ticker instead of
+                aborting the batch
+            quotes_api (SchwabAPI): Authenticated SchwabAPI instance to reuse (optional)
+        """
+        self.core.refresh_today()
+        quotes = self.core.fetcher.prefetch_schwab_quotes(tickers, api=quotes_api)
+        known_tickers = frozenset(self.core.db_helper.get_tickers_in_db())
+        known_scanner_tickers = frozenset(self.core.db_helper.get_tickers_in_db(market=market))
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(tickers))),
+            thread_name_prefix=f"Scan-{market}",
+        ) as pool:
+            futures = [
+                pool.submit(
+                    self.core.scan_ticker,
+                    stock_ticker=stock_ticker,
+                    scanner_table=scanner_table,
+                    market=market,
+                    market_type=market_type,
+                    source=source,
+                    position=position,
+                    known_tickers=known_tickers,
+                    known_scanner_tickers=known_scanner_tickers,
+                    schwab_quote=quotes.get(stock_ticker),
+                )
+                for position, stock_ticker in enumerate(tickers, start=start)
+            ]
+
+        for future in futures:
+            try:
+                future.result()
+            except ignore_errors:
+                pass
+
     def is_same_date_as_today(self, input_datetime: datetime) -> bool:
         """Checks if the input datetime has the same date as today"""
         return input_datetime.date() == datetime.now().date()
@@ -576,8 +859,10 @@ class Scanner:
 class PreMarket(Scanner):
     """Pre-market scanner implementation"""
 
-    def __init__(self, output_length: Optional[int] = None):
-        super().__init__()
+    def __init__(
+        self, output_length: Optional[int] = None, max_workers: int = DEFAULT_SCAN_WORKERS
+    ):
+        super().__init__(max_workers=max_workers)
         self.output_length = output_length
         self.stock_analysis_scanner = ScanStockAnalysis()
         self.market = "pre_market"
@@ -594,41 +879,42 @@ class PreMarket(Scanner):
 
     def stock_analysis(self):
         """Premarket Gainers from StockAnalysis.com"""
-        print("---- " * 8)
         length = self.stock_analysis_scanner.premarket_gainers_length()
-
-        for i in range(length):
-            stock_ticker = self.stock_analysis_scanner.ticker(position=i, market=self.market)
-            try:
-                self.scan_ticker(
-                    stock_ticker=stock_ticker,
-                    scanner_table=self.pre_market_scanner_table,
-                    market=self.market,
-                    market_type=self.market_type,
-                    source="Stocks Analysis",
-                    position=i,
-                )
-            except AttributeError:
-                pass
+        tickers = [
+            self.stock_analysis_scanner.ticker(position=i, market=self.market)
+            for i in range(length)
+        ]
+
+        self.scan_batch(
+            tickers=tickers,
+            scanner_table=self.pre_market_scanner_table,
+            market=self.market,
+            market_type=self.market_type,
+            source="Stocks Analysis",
+            ignore_errors=(AttributeError,),
+        )
 
     def charles_schwab_pre_market_movers(
         self, symbol_id: str = "EQUITY_ALL", sort: str = "PERCENT_CHANGE_UP"
     ):
         """Screener from Charles Schwab"""
-        print("---- " * 8)
         schwab = SchwabAPI()
         movers = schwab.movers(symbol_id=symbol_id, sort=sort)
-
-        for position, ticker in enumerate(movers["screeners"], start=1):
-            stock_ticker = ticker["symbol"]
-            self.scan_ticker(
-                stock_ticker=stock_ticker,
-                scanner_table=self.pre_market_scanner_table,
-                market=self.market,
-                market_type=self.market_type,
-                source="Charles Schwab",
-                position=position,
-            )
+        payload_key = f"schwab:{symbol_id}:{sort}"
+        digest = self._payload_digest(movers["screeners"])
+        if self._payload_digests.get(payload_key) == digest:
+            LOGGER.debug("Charles Schwab movers unchanged since last cycle, skipping")
+            return
+        self.scan_batch(
+            tickers=[ticker["symbol"] for ticker in movers["screeners"]],
+            scanner_table=self.pre_market_scanner_table,
+            market=self.market,
+            market_type=self.market_type,
+            source="Charles Schwab",
+            start=1,
+            quotes_api=schwab,
+        )
+        self._payload_digests[payload_key] = digest
 
 
 # ============================================================================
@@ -639,8 +925,10 @@ class PreMarket(Scanner):
 class RegularMarket(Scanner):
     """Regular market scanner implementation"""
 
-    def __init__(self, output_length: Optional[int] = None):
-        super().__init__()
+    def __init__(
+        self, output_length: Optional[int] = None, max_workers: int = DEFAULT_SCAN_WORKERS
+    ):
+        super().__init__(max_workers=max_workers)
         self.output_length = output_length
         self.stock_analysis_scanner = ScanStockAnalysis()
         self.market = "regular_market"
@@ -657,60 +945,59 @@ class RegularMarket(Scanner):
 
     def stock_analysis_regular_market_gainers(self):
         """Regular Market Stocks Gainers from StockAnalysis.com"""
-        print("---- " * 8)
         data_type = "gainers"
         length = self.stock_analysis_scanner.regular_market_length(data_type=data_type)
-
-        for i in range(length):
-            stock_ticker = self.stock_analysis_scanner.ticker(
-                position=i, market=self.market, data_type=data_type
-            )
-            self.scan_ticker(
-                stock_ticker=stock_ticker,
-                scanner_table=self.regular_market_scanner_table,
-                market=self.market,
-                market_type=self.market_type,
-                source="Stocks Analysis - Gainers",
-                position=i,
-            )
+        tickers = [
+            self.stock_analysis_scanner.ticker(position=i, market=self.market, data_type=data_type)
+            for i in range(length)
+        ]
+
+        self.scan_batch(
+            tickers=tickers,
+            scanner_table=self.regular_market_scanner_table,
+            market=self.market,
+            market_type=self.market_type,
+            source="Stocks Analysis - Gainers",
+        )
 
     def stock_analysis_regular_market_active(self):
         """Regular Market Stocks Active from StockAnalysis.com"""
-        print("---- " * 8)
         data_type = "active"
         length = self.stock_analysis_scanner.regular_market_length(data_type=data_type)
-
-        for i in range(length):
-            stock_ticker = self.stock_analysis_scanner.ticker(
-                position=i, market=self.market, data_type=data_type
-            )
-            self.scan_ticker(
-                stock_ticker=stock_ticker,
-                scanner_table=self.regular_market_scanner_table,
-                market=self.market,
-                market_type=self.market_type,
-                source="Stocks Analysis - Active",
-                position=i,
-            )
+        tickers = [
+            self.stock_analysis_scanner.ticker(position=i, market=self.market, data_type=data_type)
+            for i in range(length)
+        ]
+
+        self.scan_batch(
+            tickers=tickers,
+            scanner_table=self.regular_market_scanner_table,
+            market=self.market,
+            market_type=self.market_type,
+            source="Stocks Analysis - Active",
+        )
 
     def charles_schwab_regular_market_movers(
         self, symbol_id: str = "EQUITY_ALL", sort: str = "PERCENT_CHANGE_UP"
     ):
         """Screener from Charles Schwab in Regular Market"""
-        print("---- " * 8)
         schwab = SchwabAPI()
         movers = schwab.movers(symbol_id=symbol_id, sort=sort)
-
-        for position, ticker in enumerate(movers["screeners"], start=1):
-            stock_ticker = ticker["symbol"]
-            self.scan_ticker(
-                stock_ticker=stock_ticker,
-                scanner_table=self.regular_market_scanner_table,
-                market=self.market,
-                market_type=self.market_type,
-                source="Charles Schwab",
-                position=position,
-            )
+        payload_key = f"schwab:{symbol_id}:{sort}"
+        digest = self._payload_digest(movers["screeners"])
+        if self._payload_digests.get(payload_key) == digest:
+            LOGGER.debug("Charles Schwab movers unchanged since last cycle, skipping")
+            return
+        self.scan_batch(
+            tickers=[ticker["symbol"] for ticker in movers["screeners"]],
+            scanner_table=self.regular_market_scanner_table,
+            market=self.market,
+            market_type=self.market_type,
+            source="Charles Schwab",
+            start=1,
+            quotes_api=schwab,
+        )
+        self._payload_digests[payload_key] = digest
 
 
 # ============================================================================
@@ -10,11 +10,15 @@ See LICENSE and README.md for full legal disclaimers.
 """
 
 import logging
+import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from helpers.cache import TTLCache
+from helpers.http import build_session
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING)
@@ -32,6 +36,148 @@ HEADER = {
     )
 }
 
+# Shared by every page fetch: all market pages are on stockanalysis.com, so one
+# kept-alive connection avoids a TLS handshake per page
+SESSION = build_session(pool_maxsize=4, headers=HEADER)
+
+PREMARKET_GAINERS_URL = "https://stockanalysis.com/markets/premarket/"
+REGULAR_MARKET_GAINERS_URL = "https://stockanalysis.com/markets/gainers/"
+REGULAR_MARKET_ACTIVE_URL = "https://stockanalysis.com/markets/active/"
+
+# Regular market data type -> (page URL, ScanStockAnalysis attribute caching its rows)
+REGULAR_MARKET_PAGES = {
+    "gainers": (REGULAR_MARKET_GAINERS_URL, "_name_lines_regular_market_gainers"),
+    "active": (REGULAR_MARKET_ACTIVE_URL, "_name_lines_regular_market_active"),
+}
+
+# Per page URL: (conditional request headers, parsed rows) from the last full download,
+# so an unchanged page is answered with 304 Not Modified and is not parsed again
+PAGE_CACHE = TTLCache(ttl=15 * 60)
+
+# Rows of pages downloaded in the last 30 seconds, served to any scraper instance
+# without a request
+RECENT_PAGE_ROWS = TTLCache(ttl=30)
+
+
+# Market table on StockAnalysis.com pages: its id and classes, the class of its rows,
+# and the body selector built from them
+TABLE_ID = "main-table"
+TABLE_CLASSES = ("symbol-table", "svelte-1ro3niy")
+ROW_CLASS = "svelte-1ro3niy"
+TABLE_BODY_SELECTOR = f"table#{TABLE_ID}.{'.'.join(TABLE_CLASSES)} > tbody"
+
+TABLE_NOT_FOUND = "StockAnalysis.com market table not found (page blocked or layout changed)"
+
+# Index of the ticker symbol cell in each table row
+TICKER_COLUMN = 1
+
+# Restricts BeautifulSoup to the market table, skipping the page's navigation and footer
+TABLE_STRAINER = SoupStrainer("table", attrs={"id": TABLE_ID})
+
+
+def _table_rows(html: bytes | str) -> list[list[str]]:
+    """
+    Extract the market table of a StockAnalysis.com page
+
+    BeautifulSoup parses only the table itself.
+
+    Parameters:
+        html (bytes | str): Page HTML (raw bytes let the parser detect the charset itself)
+
+    Returns:
+        list[list[str]]: Stripped text of each cell, one list per table row
+
+    Raises:
+        ValueError: If the page has no market table (blocked page, changed layout)
+    """
+    soup = BeautifulSoup(html, "html.parser", parse_only=TABLE_STRAINER)
+    # One selector query for the body, then only its direct children are visited
+    body = soup.select_one(TABLE_BODY_SELECTOR)
+    if body is None:
+        raise ValueError(TABLE_NOT_FOUND)
+    rows = body.find_all("tr", class_=ROW_CLASS, recursive=False)
+    return _intern_tickers(
+        [
+            [cell.get_text(strip=True) for cell in row.find_all("td", recursive=False)]
+            for row in rows
+        ]
+    )
+
+
+def _intern_tickers(rows: list[list[str]]) -> list[list[str]]:
+    """
+    Intern the ticker cell of each row in place
+
+    The same symbols recur across pages and refreshes and are then hashed and compared
+    against the database ticker sets, so each one is kept as a single shared string.
+    """
+    for row in rows:
+        if len(row) > TICKER_COLUMN:
+            row[TICKER_COLUMN] = sys.intern(row[TICKER_COLUMN])
+    return rows
+
+
+# Attribution notice shown the first time the scraper is used in a process
+_NOTICE_RULE = "=" * 80
+STOCK_ANALYSIS_NOTICE = f"""
+{_NOTICE_RULE}
+⚠️  NOTICE: StockAnalysis.com Web Scraper
+{_NOTICE_RULE}
+You are using a web scraper for StockAnalysis.com.
+
+REQUIREMENTS:
+  • You MUST attribute data to https://stockanalysis.com/
+  • Do NOT modify the scraped content
+  • Do NOT republish full content without permission
+
+RECOMMENDATION:
+  Consider using official APIs for more reliable data:
+  - Charles Schwab (FREE)
+  - Alpha Vantage (FREE tier available)
+  - See README.md for ToS-compliant alternatives
+
+BY CONTINUING, YOU AGREE TO COMPLY WITH ATTRIBUTION REQUIREMENTS.
+{_NOTICE_RULE}"""
+_NOTICE_SHOWN = False
+
+
+def _fetch_table_rows(url: str) -> list[list[str]]:
+    """
+    Download a StockAnalysis.com market page and extract its table rows
+
+    Pages downloaded within RECENT_PAGE_ROWS' TTL are served from it. Otherwise the
+    page's ETag/Last-Modified validators are sent when known, reusing the previously
+    parsed rows if the server answers 304 Not Modified.
+
+    Raises:
+        RuntimeError: If the page is answered with an error status (nothing is cached)
+        ValueError: If the page has no market table
+    """
+    rows = RECENT_PAGE_ROWS.get(url)
+    if rows is not None:
+        return rows
+
+    cached = PAGE_CACHE.get(url)
+    response = SESSION.get(url, headers=cached[0] if cached else None, timeout=30)
+    if cached and response.status_code == 304:
+        RECENT_PAGE_ROWS.set(url, cached[1])
+        return cached[1]
+
+    if response.status_code != 200:
+        logger.warning("StockAnalysis.com returned HTTP %s for %s", response.status_code, url)
+        raise RuntimeError(f"StockAnalysis.com returned HTTP {response.status_code} for {url}")
+
+    rows = _table_rows(response.content)
+    validators = {}
+    if response.headers.get("ETag"):
+        validators["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = response.headers["Last-Modified"]
+    if validators:
+        PAGE_CACHE.set(url, (validators, rows))
+    RECENT_PAGE_ROWS.set(url, rows)
+    return rows
+
 
 class ScanStockAnalysis:
     """
@@ -46,26 +192,11 @@ class ScanStockAnalysis:
     """
 
     def __init__(self):
-        # Issue informational warning on instantiation
-        warnings.warn(
-            "\n" + "=" * 80 + "\n"
-            "⚠️  NOTICE: StockAnalysis.com Web Scraper\n"
-            "=" * 80 + "\n"
-            "You are using a web scraper for StockAnalysis.com.\n\n"
-            "REQUIREMENTS:\n"
-            "  • You MUST attribute data to https://stockanalysis.com/\n"
-            "  • Do NOT modify the scraped content\n"
-            "  • Do NOT republish full content without permission\n\n"
-            "RECOMMENDATION:\n"
-            "  Consider using official APIs for more reliable data:\n"
-            "  - Charles Schwab (FREE)\n"
-            "  - Alpha Vantage (FREE tier available)\n"
-            "  - See README.md for ToS-compliant alternatives\n\n"
-            "BY CONTINUING, YOU AGREE TO COMPLY WITH ATTRIBUTION REQUIREMENTS.\n"
-            "=" * 80,
-            UserWarning,
-            stacklevel=2,
-        )
+        # Issue the informational warning once per process
+        global _NOTICE_SHOWN  # pylint: disable=global-statement
+        if not _NOTICE_SHOWN:
+            _NOTICE_SHOWN = True
+            warnings.warn(STOCK_ANALYSIS_NOTICE, UserWarning, stacklevel=2)
         logger.info("ScanStockAnalysis scraper initialized - Remember to attribute data source")
 
         self._name_lines_premarket_gainers = None
@@ -74,62 +205,45 @@ class ScanStockAnalysis:
 
     def _initialize_premarket_gainers(self):
         if not self._name_lines_premarket_gainers:
-            url = "https://stockanalysis.com/markets/premarket/"
-            response = requests.get(url, headers=HEADER, timeout=30)
-            soup = BeautifulSoup(response.text, "html.parser")
-            self._name_lines_premarket_gainers = (
-                soup.find(
-                    "table",
-                    class_="symbol-table svelte-1ro3niy",
-                    attrs={"id": "main-table"},
-                )
-                .find("tbody")
-                .find_all("tr", class_="svelte-1ro3niy")
-            )
+            self._name_lines_premarket_gainers = _fetch_table_rows(PREMARKET_GAINERS_URL)
 
-    def _initialize_regular_market(self, data_type):
-        if data_type == "gainers" and not self._name_lines_regular_market_gainers:
-            url = "https://stockanalysis.com/markets/gainers/"
-            response = requests.get(url, headers=HEADER, timeout=30)
-            soup = BeautifulSoup(response.text, "html.parser")
-            self._name_lines_regular_market_gainers = (
-                soup.find(
-                    "table",
-                    class_="symbol-table svelte-1ro3niy",
-                    attrs={"id": "main-table"},
-                )
-                .find("tbody")
-                .find_all("tr", class_="svelte-1ro3niy")
-            )
+    def _regular_market_rows(self, data_type: str) -> list[list[str]]:
+        """Return the rows of a regular market page, downloading it on first use"""
+        try:
+            url, attr = REGULAR_MARKET_PAGES[data_type]
+        except KeyError:
+            raise ValueError(
+                f"Invalid data_type: '{data_type}'. Must be 'gainers' or 'active'"
+            ) from None
+        rows = getattr(self, attr)
+        if not rows:
+            rows = _fetch_table_rows(url)
+            setattr(self, attr, rows)
+        return rows
 
-        elif data_type == "active" and not self._name_lines_regular_market_active:
-            url = "https://stockanalysis.com/markets/active/"
-            response = requests.get(url, headers=HEADER, timeout=30)
-            soup = BeautifulSoup(response.text, "html.parser")
-            self._name_lines_regular_market_active = (
-                soup.find(
-                    "table",
-                    class_="symbol-table svelte-1ro3niy",
-                    attrs={"id": "main-table"},
-                )
-                .find("tbody")
-                .find_all("tr", class_="svelte-1ro3niy")
-            )
+    def prefetch_all(self):
+        """
+        Download every market page not loaded yet, concurrently
+
+        Optional: the lazy per-page loading still applies when this is not called.
+        """
+        pages = {"_name_lines_premarket_gainers": PREMARKET_GAINERS_URL}
+        pages.update((attr, url) for url, attr in REGULAR_MARKET_PAGES.values())
+        missing = {attr: url for attr, url in pages.items() if not getattr(self, attr)}
+        if not missing:
+            return
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            rows = list(pool.map(_fetch_table_rows, missing.values()))
+        for attr, page_rows in zip(missing, rows):
+            setattr(self, attr, page_rows)
 
     def _get_premarket_gainer_info(self, position: int, column: int):
         self._initialize_premarket_gainers()
         row = self._name_lines_premarket_gainers[position]
-        return row.find_all("td")[column].get_text(strip=True)
+        return row[column]
 
     def _get_regular_market_info(self, position: int, column: int, data_type: str):
-        self._initialize_regular_market(data_type)
-        if data_type == "gainers":
-            row = self._name_lines_regular_market_gainers[position]
-            return row.find_all("td")[column].get_text(strip=True)
-        if data_type == "active":
-            row = self._name_lines_regular_market_active[position]
-            return row.find_all("td")[column].get_text(strip=True)
-        raise ValueError(f"Invalid data_type: '{data_type}'. Must be 'gainers' or 'active'")
+        return self._regular_market_rows(data_type)[position][column]
 
     def regular_market_length(self, data_type: str):
         """
@@ -138,12 +252,7 @@ class ScanStockAnalysis:
         Parameters:
             data_type (str): Data type
         """
-        self._initialize_regular_market(data_type=data_type)
-        if data_type == "gainers":
-            return len(self._name_lines_regular_market_gainers)
-        if data_type == "active":
-            return len(self._name_lines_regular_market_active)
-        raise ValueError(f"Invalid data_type: '{data_type}'. Must be 'gainers' or 'active'")
+        return len(self._regular_market_rows(data_type))
 
     def premarket_gainers_length(self):
         """
@@ -166,9 +275,11 @@ class ScanStockAnalysis:
             Ticker symbol or related information for the specified position
         """
         if market == "pre_market" and data_type is None:
-            return self._get_premarket_gainer_info(position=position, column=1)
+            return self._get_premarket_gainer_info(position=position, column=TICKER_COLUMN)
         if market == "regular_market":
             if data_type is None:
                 raise ValueError("'data_type' must be provided for 'regular_market'")
-            return self._get_regular_market_info(position=position, column=1, data_type=data_type)
+            return self._get_regular_market_info(
+                position=position, column=TICKER_COLUMN, data_type=data_type
+            )
         raise ValueError("market must be either 'pre_market' or 'regular_market'")
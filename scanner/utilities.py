@@ -2,11 +2,12 @@
 Utilities and helper functions for the scanner module
 
 This module contains:
-- Data structures (StockQuoteData, NewsItem)
+- Data structures (StockQuoteData, YahooFundamentals, NewsItem)
 - Searching utility class
 - Helper functions
 """
 
+import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
@@ -20,7 +21,7 @@ from .apis import SearchYahooFinance
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class StockQuoteData:
     """Data structure for stock quotes"""
 
@@ -35,15 +36,37 @@ class StockQuoteData:
     avg_vol_3_month: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class YahooFundamentals:
+    """Data structure for company profile and short-interest data from Yahoo Finance"""
+
+    company_country: Optional[str] = None
+    business_website: Optional[str] = None
+    business_summary: Optional[str] = None
+    stock_float: Optional[float] = None
+    held_insiders: Optional[float] = None
+    held_institutions: Optional[float] = None
+    operating_cash_flow: Optional[float] = None
+    sector: Optional[str] = None
+    industry: Optional[str] = None
+    short_ratio: Optional[float] = None
+    shares_short: Optional[float] = None
+    short_percent_float: Optional[float] = None
+    shares_percent_shares_outstanding: Optional[float] = None
+    shares_short_prior_month: Optional[float] = None
+    shares_short_previous_month_date: Optional[int] = None
+    short_ratio_date: Optional[int] = None
+
+
+@dataclass(slots=True)
 class NewsItem:
     """Data structure for news items"""
 
-    uuid_news: str
+    uuid_news: uuid.UUID
     title: str
     publisher: str
     link: str
-    publish_time: str
+    publish_time: datetime
     content_type: str
     related_tickers: Optional[List[str]] = None
 
@@ -64,41 +87,46 @@ class Searching:
         helper = Helpers()
         search = SearchYahooFinance(ticker=self.stock_ticker)
 
-        print("---- ---- " * 4)
-        print(f"Ticker -> {self.stock_ticker}")
+        # Collected and printed at once, so output of concurrent searches does not interleave
+        lines = ["---- ---- " * 4, f"Ticker -> {self.stock_ticker}"]
 
-        stock_float = helper.format_number(search.stock_float()) if search.stock_float() else None
-        market_cap = helper.format_number(search.market_cap()) if search.market_cap() else None
-        held_insiders = (
-            helper.format_percentage(search.held_insiders()) if search.held_insiders() else None
-        )
+        # Each field is read once; they all come from one cached Ticker info lookup
+        stock_float = search.stock_float()
+        market_cap = search.market_cap()
+        held_insiders = search.held_insiders()
+        held_institutions = search.held_institutions()
+        avg_vol_3_month = search.avg_volume_3m()
+        avg_vol_10_day = search.avg_volume_10d()
+
+        stock_float = helper.format_number(stock_float) if stock_float else None
+        market_cap = helper.format_number(market_cap) if market_cap else None
+        held_insiders = helper.format_percentage(held_insiders) if held_insiders else None
         held_institutions = (
-            helper.format_percentage(search.held_institutions())
-            if search.held_institutions()
-            else None
-        )
-        avg_vol_3_month = (
-            helper.format_number(search.avg_volume_3m()) if search.avg_volume_3m() else None
+            helper.format_percentage(held_institutions) if held_institutions else None
         )
-        avg_vol_10_day = (
-            helper.format_number(search.avg_volume_10d()) if search.avg_volume_10d() else None
-        )
-
-        print(f"Stock Float -> {stock_float}")
-        print(f"Market Cap -> {market_cap}")
-        print(f"Held by Insiders -> {held_insiders}")
-        print(f"Held by Institutions -> {held_institutions}")
-        print(f"Avg Vol (3 month) -> {avg_vol_3_month}")
-        print(f"Avg Vol (10 day) -> {avg_vol_10_day}")
-        print(f"Short Ratio -> {search.short_ratio()}")
-        print(f"Sector -> {search.sector()}")
-        print(f"Industry -> {search.industry()}")
+        avg_vol_3_month = helper.format_number(avg_vol_3_month) if avg_vol_3_month else None
+        avg_vol_10_day = helper.format_number(avg_vol_10_day) if avg_vol_10_day else None
+
+        lines += [
+            f"Stock Float -> {stock_float}",
+            f"Market Cap -> {market_cap}",
+            f"Held by Insiders -> {held_insiders}",
+            f"Held by Institutions -> {held_institutions}",
+            f"Avg Vol (3 month) -> {avg_vol_3_month}",
+            f"Avg Vol (10 day) -> {avg_vol_10_day}",
+            f"Short Ratio -> {search.short_ratio()}",
+            f"Sector -> {search.sector()}",
+            f"Industry -> {search.industry()}",
+        ]
 
         company_news = search.company_news()
         for position, news in enumerate(company_news, start=1):
-            print("---- ---- " * 2)
-            print(f"- News {position} / UUID: {news.get('uuid', news.get('id'))}")
-            print(f"- News {position} / Title: {news.get('title', 'N/A')}")
-            print(f"- News {position} / Publisher: {news.get('publisher', 'N/A')}")
-
-        print("---- ---- " * 4)
+            lines += [
+                "---- ---- " * 2,
+                f"- News {position} / UUID: {news.get('uuid', news.get('id'))}",
+                f"- News {position} / Title: {news.get('title', 'N/A')}",
+                f"- News {position} / Publisher: {news.get('publisher', 'N/A')}",
+            ]
+
+        lines.append("---- ---- " * 4)
+        print("\n".join(lines))
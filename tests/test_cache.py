@@ -0,0 +1,96 @@
+"""Tests for the in-memory caches and SingleFlight of helpers.cache"""
+
+import threading
+import unittest
+from unittest import mock
+
+from helpers.cache import SingleFlight, TTLCache
+
+
+class TTLCacheTest(unittest.TestCase):
+    """TTLCache expires entries after its ttl and purges them on set"""
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch("helpers.cache.time.monotonic", side_effect=lambda: self.now)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        self.cache = TTLCache(ttl=10)
+
+    def test_get_before_and_after_expiry(self):
+        self.cache.set("AAPL", 1)
+        self.now += 10
+        self.assertEqual(self.cache.get("AAPL"), 1)
+        self.now += 0.5
+        self.assertIsNone(self.cache.get("AAPL"))
+        self.assertEqual(self.cache.get("AAPL", "missing"), "missing")
+
+    def test_cached_none_is_distinct_from_missing(self):
+        self.cache.set("AAPL", None)
+        self.assertIsNone(self.cache.get("AAPL", "missing"))
+
+    def test_invalidate(self):
+        self.cache.set("AAPL", 1)
+        self.cache.set("MSFT", 2)
+        self.cache.invalidate("AAPL")
+        self.assertIsNone(self.cache.get("AAPL"))
+        self.assertEqual(self.cache.get("MSFT"), 2)
+        self.cache.invalidate()
+        self.assertIsNone(self.cache.get("MSFT"))
+
+    def test_set_purges_expired_entries(self):
+        self.cache.set("AAPL", 1)
+        self.now += 11
+        self.cache.set("MSFT", 2)
+        self.assertEqual(set(self.cache._entries), {"MSFT"})  # pylint: disable=protected-access
+
+
+class SingleFlightTest(unittest.TestCase):
+    """SingleFlight shares one in-progress call between callers of the same key"""
+
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_call():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "quotes"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("key", slow_call)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(flight.do("key", slow_call)))
+        follower.start()
+        # The follower is now waiting on the leader's call (it cannot start its own)
+        follower.join(0.1)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(results, ["quotes", "quotes"])
+        self.assertEqual(len(calls), 1)
+
+    def test_exception_is_shared_and_key_released(self):
+        flight = SingleFlight()
+
+        def failing_call():
+            raise OSError("timeout")
+
+        with self.assertRaises(OSError):
+            flight.do("key", failing_call)
+        self.assertEqual(flight.do("key", lambda: "retried"), "retried")
+
+    def test_sequential_calls_are_not_shared(self):
+        flight = SingleFlight()
+        counter = iter(range(10))
+        self.assertEqual(flight.do("key", lambda: next(counter)), 0)
+        self.assertEqual(flight.do("key", lambda: next(counter)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
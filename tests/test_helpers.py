@@ -0,0 +1,39 @@
+"""Tests for the conversion helpers of helpers.helpers"""
+
+import unittest
+from datetime import datetime
+
+from helpers.helpers import Helpers
+
+
+class DetectAndConvertTimestampTest(unittest.TestCase):
+    """Timestamps are classified by magnitude and converted to naive UTC"""
+
+    def setUp(self):
+        self.helper = Helpers()
+
+    def test_seconds_and_milliseconds(self):
+        expected = datetime(2023, 10, 31, 15, 17, 12)
+        self.assertEqual(self.helper.detect_and_convert_timestamp(1698765432), expected)
+        self.assertEqual(self.helper.detect_and_convert_timestamp(1698765432000), expected)
+        self.assertEqual(self.helper.detect_and_convert_timestamp(1698765432.0), expected)
+
+    def test_result_is_naive(self):
+        self.assertIsNone(self.helper.detect_and_convert_timestamp(1698765432).tzinfo)
+
+    def test_type(self):
+        convert = self.helper.detect_and_convert_timestamp
+        self.assertEqual(convert(1698765432, resultado="type"), "Unix timestamp (seconds)")
+        self.assertEqual(convert(1698765432000, resultado="type"), "Timestamp in milliseconds")
+        # The threshold itself (1e12) counts as milliseconds
+        self.assertEqual(convert(1e12, resultado="type"), "Timestamp in milliseconds")
+        self.assertEqual(convert(1e12 - 1, resultado="type"), "Unix timestamp (seconds)")
+
+    def test_none_and_invalid_result(self):
+        self.assertIsNone(self.helper.detect_and_convert_timestamp(None))
+        with self.assertRaises(ValueError):
+            self.helper.detect_and_convert_timestamp(1698765432, resultado="text")
+
+
+if __name__ == "__main__":
+    unittest.main()
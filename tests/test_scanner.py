@@ -0,0 +1,41 @@
+"""Tests for the screener payload skip of scanner.scanner"""
+
+import unittest
+import warnings
+from unittest import mock
+
+from scanner.scanner import PreMarket
+
+MOVERS = {"screeners": [{"symbol": "AAA", "lastPrice": 1.5}, {"symbol": "BBB", "lastPrice": 2.5}]}
+
+
+class PayloadSkipTest(unittest.TestCase):
+    """An identical screener payload is only skipped once its scan succeeded"""
+
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.scanner = PreMarket()
+        patcher = mock.patch("scanner.scanner.SchwabAPI")
+        self.addCleanup(patcher.stop)
+        patcher.start().return_value.movers.return_value = MOVERS
+
+    def test_unchanged_payload_is_skipped(self):
+        with mock.patch.object(PreMarket, "scan_batch") as scan_batch:
+            self.scanner.charles_schwab_pre_market_movers()
+            self.scanner.charles_schwab_pre_market_movers()
+        self.assertEqual(scan_batch.call_count, 1)
+
+    def test_failed_batch_is_retried(self):
+        with mock.patch.object(
+            PreMarket, "scan_batch", side_effect=[RuntimeError("database down"), None, None]
+        ) as scan_batch:
+            with self.assertRaises(RuntimeError):
+                self.scanner.charles_schwab_pre_market_movers()
+            self.scanner.charles_schwab_pre_market_movers()
+            self.scanner.charles_schwab_pre_market_movers()
+        self.assertEqual(scan_batch.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Tests for the bulk insert paths of db.scanners_db"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from psycopg2 import OperationalError
+
+from db.scanners_db import (
+    COPY_THRESHOLD,
+    DatabaseConnection,
+    DatabaseOperation,
+    InsertData,
+    _copy_field,
+    _to_server_placeholders,
+)
+
+NEW_YORK = timezone(timedelta(hours=-5))
+
+
+class FakeCursor:
+    """Cursor recording the data sent through COPY"""
+
+    def __init__(self, error=None):
+        self.copied = None
+        self.error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, _statement, buffer):
+        if self.error:
+            raise self.error
+        self.copied = buffer.read()
+
+
+class FakeConnection:
+    """Connection handing out a single FakeCursor"""
+
+    closed = False
+
+    def __init__(self, error=None):
+        self.cursor_obj = FakeCursor(error)
+
+    def cursor(self):
+        return self.cursor_obj
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class RecordingCursor:
+    """Cursor recording the statements it executes"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.executed = []
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+
+class PreparedStatementTest(unittest.TestCase):
+    """execute_prepared prepares each query once per connection"""
+
+    QUERY = "SELECT ticker FROM equities.stock_data WHERE ticker = %s AND volume > %s"
+
+    def test_placeholders_are_numbered(self):
+        self.assertEqual(
+            _to_server_placeholders(self.QUERY),
+            ("SELECT ticker FROM equities.stock_data WHERE ticker = $1 AND volume > $2", 2),
+        )
+        self.assertEqual(_to_server_placeholders("SELECT 1"), ("SELECT 1", 0))
+
+    def test_prepare_once_per_connection(self):
+        connection = FakeConnection()
+        cursor = RecordingCursor(connection)
+        DatabaseOperation.execute_prepared(cursor, self.QUERY, ("AAPL", 100))
+        DatabaseOperation.execute_prepared(cursor, self.QUERY, ("MSFT", 200))
+
+        (prepare, prepare_params), first, second = cursor.executed
+        name = prepare.split()[1]
+        self.assertEqual(prepare, f"PREPARE {name} AS " + _to_server_placeholders(self.QUERY)[0])
+        self.assertIsNone(prepare_params)
+        self.assertEqual(first, (f"EXECUTE {name} (%s, %s)", ("AAPL", 100)))
+        self.assertEqual(second, (f"EXECUTE {name} (%s, %s)", ("MSFT", 200)))
+
+        other_cursor = RecordingCursor(FakeConnection())
+        DatabaseOperation.execute_prepared(other_cursor, self.QUERY, ("AAPL", 100))
+        self.assertTrue(other_cursor.executed[0][0].startswith(f"PREPARE {name} AS"))
+
+    def test_query_without_params(self):
+        cursor = RecordingCursor(FakeConnection())
+        DatabaseOperation.execute_prepared(cursor, "SELECT COUNT(*) FROM equities.stock_data")
+        name = cursor.executed[0][0].split()[1]
+        self.assertEqual(cursor.executed[1], (f"EXECUTE {name}", None))
+
+
+class CopyFieldTest(unittest.TestCase):
+    """_copy_field renders values in COPY text format"""
+
+    def test_none(self):
+        self.assertEqual(_copy_field(None), "\\N")
+
+    def test_arrays(self):
+        self.assertEqual(_copy_field(["AAPL", None, 'a"b']), '{"AAPL",NULL,"a\\\\"b"}')
+        self.assertEqual(_copy_field(()), "{}")
+
+    def test_escapes(self):
+        self.assertEqual(_copy_field("a\tb\nc\rd\\e"), "a\\tb\\nc\\rd\\\\e")
+
+    def test_datetimes(self):
+        self.assertEqual(_copy_field(datetime(2024, 5, 1, 13, 30)), "2024-05-01T13:30:00")
+        self.assertEqual(
+            _copy_field(datetime(2024, 5, 1, 13, 30, tzinfo=timezone.utc)),
+            "2024-05-01T13:30:00+00:00",
+        )
+
+
+class InsertManyTest(unittest.TestCase):
+    """insert_many must map values by column name on every path"""
+
+    def _insert(self, connection, rows):
+        with mock.patch.object(
+            DatabaseConnection, "get_connection", return_value=connection
+        ), mock.patch.object(DatabaseConnection, "release_connection"):
+            return InsertData().insert_many("equities.stock_news", rows)
+
+    def test_copy_path_mixed_key_order(self):
+        connection = FakeConnection()
+        rows = [
+            {"ticker": f"T{i}", "volume": i} if i % 2 == 0 else {"volume": i, "ticker": f"T{i}"}
+            for i in range(COPY_THRESHOLD)
+        ]
+        with mock.patch.object(
+            DatabaseConnection, "get_connection", return_value=connection
+        ), mock.patch.object(DatabaseConnection, "release_connection"):
+            InsertData().insert_many("equities.stock_data", rows)
+
+        lines = connection.cursor_obj.copied.splitlines()
+        self.assertEqual(len(lines), COPY_THRESHOLD)
+        for i, line in enumerate(lines):
+            self.assertEqual(line, f"T{i}\t{i}")
+
+    def test_datetimes_match_on_both_paths(self):
+        published = datetime(2024, 5, 1, 9, 30, tzinfo=NEW_YORK)
+        with mock.patch("psycopg2.extras.execute_values") as execute_values:
+            self.assertTrue(self._insert(FakeConnection(), [{"publish_time": published}]))
+        (sent,) = execute_values.call_args.args[2][0]
+        self.assertEqual(sent, published)
+        self.assertEqual(sent.utcoffset(), timedelta(0))
+
+        connection = FakeConnection()
+        self.assertTrue(self._insert(connection, [{"publish_time": published}] * COPY_THRESHOLD))
+        self.assertEqual(connection.cursor_obj.copied.splitlines()[0], sent.isoformat())
+
+    def test_failed_copy_returns_false(self):
+        connection = FakeConnection(error=OperationalError("connection lost"))
+        with self.assertLogs("db.scanners_db", level="ERROR"):
+            self.assertFalse(self._insert(connection, [{"ticker": "T"}] * COPY_THRESHOLD))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Tests for the StockAnalysis.com table extraction of scanner.scrapers"""
+
+import re
+import unittest
+
+from scanner.scrapers import TABLE_NOT_FOUND, _table_rows
+
+PAGE = """<html><body>
+<nav><table id="nav-table"><tr><td>Home</td></tr></table></nav>
+<table id="main-table" class="symbol-table svelte-1ro3niy">
+<thead><tr><th>No.</th><th>Symbol</th><th>Change</th></tr></thead>
+<tbody>{rows}</tbody>
+</table>
+</body></html>"""
+
+ROWS = """
+<tr class="svelte-1ro3niy"><td>1</td><td><a href="/stocks/abcd/">ABCD</a></td><td> 45.2%</td></tr>
+<tr class="svelte-1ro3niy"><td>2</td><td><a href="/stocks/wxyz/">WXYZ</a></td><td>31.0% </td></tr>
+"""
+
+
+class TableRowsTest(unittest.TestCase):
+    """_table_rows returns the stripped cells of the market table body"""
+
+    def test_rows(self):
+        self.assertEqual(
+            _table_rows(PAGE.format(rows=ROWS)),
+            [["1", "ABCD", "45.2%"], ["2", "WXYZ", "31.0%"]],
+        )
+
+    def test_rows_from_bytes(self):
+        rows = _table_rows(PAGE.format(rows=ROWS).encode("utf-8"))
+        self.assertEqual([row[1] for row in rows], ["ABCD", "WXYZ"])
+
+    def test_empty_table(self):
+        self.assertEqual(_table_rows(PAGE.format(rows="")), [])
+
+    def test_missing_table(self):
+        with self.assertRaisesRegex(ValueError, re.escape(TABLE_NOT_FOUND)):
+            _table_rows("<html><body><p>Access denied</p></body></html>")
+
+
+if __name__ == "__main__":
+    unittest.main()